@@ -0,0 +1,41 @@
+
+
+;---------------------
+; Bore Operation
+; Tool dia: 3.175
+; Top Center:
+;   X = 5.000
+;   Y = 20.000
+;   Z = 0.000
+; Dia   = 4.000
+; Depth = 7.000
+;---------------------
+G0 Z5.000 F100
+G0 X4.900 Y19.600 F100
+G0 Z0.150 F100
+G2 Z-0.150 I0.100 J0.400 F100
+G2 Z-0.450 I0.100 J0.400 F100
+G2 Z-0.750 I0.100 J0.400 F100
+G2 Z-1.050 I0.100 J0.400 F100
+G2 Z-1.350 I0.100 J0.400 F100
+G2 Z-1.650 I0.100 J0.400 F100
+G2 Z-1.950 I0.100 J0.400 F100
+G2 Z-2.250 I0.100 J0.400 F100
+G2 Z-2.550 I0.100 J0.400 F100
+G2 Z-2.850 I0.100 J0.400 F100
+G2 Z-3.150 I0.100 J0.400 F100
+G2 Z-3.450 I0.100 J0.400 F100
+G2 Z-3.750 I0.100 J0.400 F100
+G2 Z-4.050 I0.100 J0.400 F100
+G2 Z-4.350 I0.100 J0.400 F100
+G2 Z-4.650 I0.100 J0.400 F100
+G2 Z-4.950 I0.100 J0.400 F100
+G2 Z-5.250 I0.100 J0.400 F100
+G2 Z-5.550 I0.100 J0.400 F100
+G2 Z-5.850 I0.100 J0.400 F100
+G2 Z-6.150 I0.100 J0.400 F100
+G2 Z-6.450 I0.100 J0.400 F100
+G2 Z-6.750 I0.100 J0.400 F100
+G2 Z-7.000 I0.100 J0.400 F100
+G2 I0.100 J0.400 F100
+G0 Z5.000 F100
\ No newline at end of file
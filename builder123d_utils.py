@@ -3,11 +3,12 @@
 # Additional utilities for 123D Builder.
 #
 
+import math
 from typing import List
-import numpy as np
 from build123d import (
     Wire,
     Face,
+    GeomType,
 )
 
 
@@ -24,37 +25,61 @@ def wire_is_circle(wire: Wire) -> bool:
     if len(edges) != 2:
         return False
 
+    e0, e1 = edges
+
     # Check the radii
-    if not np.isclose(edges[0].radius, edges[1].radius):
+    # Only circular edges have a radius, so bail out cheaply on the others.
+    if e0.geom_type != GeomType.CIRCLE or e1.geom_type != GeomType.CIRCLE:
+        return False
+    if not math.isclose(e0.radius, e1.radius, rel_tol=1e-9, abs_tol=1e-9):
         return False
 
     # Check the vertices
-    v0 = edges[0].vertices()
-    v1 = edges[1].vertices()
-    if v0[0] != v1[1]:
-        return False
+    v0 = e0.vertices()
+    v1 = e1.vertices()
+    return v0[0] == v1[1] and v0[1] == v1[0]
 
-    if v0[1] != v1[0]:
-        return False
 
-    return True
+def _wire_is_circle_cached(wire: Wire) -> bool:
+    """
+    Cached version of wire_is_circle.
+    Result is stored on the wire keyed on the hash of the wrapped OCCT
+    shape.  Shape.move()/locate() change that hash, so a moved wire is
+    re-evaluated.
+    """
+    key = hash(wire.wrapped)
+    cache = getattr(wire, "_is_circle_cache", None)
+    if cache is None or cache[0] != key:
+        cache = (key, wire_is_circle(wire))
+        wire._is_circle_cache = cache
+    return cache[1]
 
 
 # Bind the method to the Wire class
-Wire.is_circle = property(lambda self: wire_is_circle(self))
+Wire.is_circle = property(_wire_is_circle_cached)
 
 
 def face_circular_holes(face: Face) -> List[Wire]:
     """
     Return a list of circular holes in the face.
     """
-    holes = []
-    for wire in face.inner_wires():
-        if wire.is_circle:
-            holes.append(wire)
+    return [wire for wire in face.inner_wires() if wire_is_circle(wire)]
+
 
-    return holes
+def _face_circular_holes_cached(face: Face) -> List[Wire]:
+    """
+    Cached version of face_circular_holes.
+    Result is stored on the face keyed on the hash of the wrapped OCCT
+    shape, so moving the face recomputes the holes at the new location.
+    Each caller gets its own copy of the list.
+    """
+    key = hash(face.wrapped)
+    cache = getattr(face, "_circular_holes_cache", None)
+    if cache is None or cache[0] != key:
+        cache = (key, face_circular_holes(face))
+        face._circular_holes_cache = cache
+    return list(cache[1])
 
 
 # Bind the method to the Face class
-Face.circular_holes = property(lambda self: face_circular_holes(self))
+Face.circular_holes = property(_face_circular_holes_cached)
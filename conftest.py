@@ -47,9 +47,10 @@ def show_result(pytestconfig):
 def part_load(fn: str) -> Solid:
 
     assert isinstance(fn, str)
-    assert Path(fn).exists()
+    path = Path(fn)
+    assert path.is_file()
 
     part = import_step(fn)
-    part.label = Path(fn).stem
+    part.label = path.stem
     part.color = Color("Orange", alpha=0.5)
     return part
@@ -0,0 +1,71 @@
+G0 Z5.000 F100
+
+
+; Pass 1
+G0 X-0.317 Y-1.746 F100
+G0 Z-0.500 F100
+G1 Y30.746 F100
+G1 X0.953 F100
+G1 Y-1.746 F100
+G1 X2.223 F100
+G1 Y30.746 F100
+G1 X3.493 F100
+G1 Y-1.746 F100
+G1 X4.763 F100
+G1 Y30.746 F100
+G1 X6.033 F100
+G1 Y-1.746 F100
+G1 X7.303 F100
+G1 Y30.746 F100
+G1 X8.572 F100
+G1 Y-1.746 F100
+G1 X9.842 F100
+G1 Y30.746 F100
+G1 X11.112 F100
+G1 Y-1.746 F100
+G1 X12.382 F100
+G1 Y30.746 F100
+G1 X13.652 F100
+G1 Y-1.746 F100
+G1 X14.922 F100
+G1 Y30.746 F100
+G1 X16.192 F100
+G1 Y-1.746 F100
+G1 X17.462 F100
+G1 Y30.746 F100
+G1 X18.732 F100
+G1 Y-1.746 F100
+G1 X20.002 F100
+G1 Y30.746 F100
+G1 X21.272 F100
+G1 Y-1.746 F100
+G1 X22.542 F100
+G1 Y30.746 F100
+G1 X23.812 F100
+G1 Y-1.746 F100
+G1 X25.082 F100
+G1 Y30.746 F100
+G1 X26.352 F100
+G1 Y-1.746 F100
+G1 X27.622 F100
+G1 Y30.746 F100
+G1 X28.892 F100
+G1 Y-1.746 F100
+G1 X30.162 F100
+G1 Y30.746 F100
+G1 X31.432 F100
+G1 Y-1.746 F100
+G1 X32.702 F100
+G1 Y30.746 F100
+G1 X33.972 F100
+G1 Y-1.746 F100
+G1 X35.242 F100
+G1 Y30.746 F100
+G1 X36.513 F100
+G1 Y-1.746 F100
+G1 X37.783 F100
+G1 Y30.746 F100
+G1 X39.053 F100
+G1 Y-1.746 F100
+G1 X40.323 F100
+G0 Z5.000 F100
\ No newline at end of file
@@ -28,30 +28,125 @@
 # TODO: See if Doc, Layout and Shape can come from the same base class.
 
 from os import P_WAIT
+from collections import OrderedDict
+from enum import IntEnum
+from types import MappingProxyType
 import numpy as np
 import math
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Stack marker for layouts whose children have all been emitted.
+_EXIT = object()
+
+# Unit vectors for axis aligned line angles, in degrees.
+_AXIS_UNIT = {0: (1.0, 0.0), 90: (0.0, 1.0), 180: (-1.0, 0.0), 270: (0.0, -1.0)}
+
+# G-code line templates for shape moves.
+_FMT_G0_Z_F    = 'G0 Z%.3f F%.1f'
+_FMT_G0_XY_F   = 'G0 X%.3f Y%.3f F%.1f'
+_FMT_G0_Z      = 'G0 Z%.3f'
+_FMT_G1_F      = 'G1 F%.1f'
+_FMT_G1_XY     = 'G1 X%.3f Y%.3f'
+_FMT_F         = 'F%.1f'
+
+# Text point move, G0 or G1 depending on laser state.
+_FMT_TEXT_XY   = '%s X%.3f Y%.3f Z0'
+
+# Rectangle outline, one line per side.  Line separators are the document EOL.
+_FMT_RECT = ('G1 X%.3f Y%.3f (Left)%s'
+             'G1 X%.3f Y%.3f (Top)%s'
+             'G1 X%.3f Y%.3f (Right)%s'
+             'G1 X%.3f Y%.3f (Bottom)')
+
+# Grid size, in cells, from which the numba cell origin kernel is used when
+# numba is installed.  Smaller grids use NumPy and never trigger a compile.
+_NUMBA_MIN_CELLS = 10000
+
+def _compute_cell_origins(col_widths, row_heights, widths, heights, x_base, y_base):
+    '''
+    Object positions for all cells of a grid layout.
+    Each object is centered in its cell.  Columns accumulate left to right,
+    rows accumulate bottom to top with row 0 at the top.
+
+    Parameters:
+    col_widths: Column widths, shape (cols,).
+    row_heights: Row heights, shape (rows,).
+    widths: Object widths, shape (rows,cols).
+    heights: Object heights, shape (rows,cols).
+    x_base, y_base: Lower left corner of the grid.
+
+    Returns (xs,ys) arrays of shape (rows,cols).
+    '''
+    if numba is not None and widths.size >= _NUMBA_MIN_CELLS:
+        return _compute_cell_origins_loop(col_widths, row_heights, widths, heights, x_base, y_base)
+
+    rows = len(row_heights)
+    col_x = np.concatenate(([0.0], np.cumsum(col_widths)))
+    row_y = np.concatenate(([0.0], np.cumsum(row_heights[::-1])))
+
+    xs = x_base + col_x[:-1]                + (col_widths          - widths )/2
+    ys = y_base + row_y[rows-1::-1][:,None] + (row_heights[:,None] - heights)/2
+    return xs, ys
+
+def _compute_cell_origins_loop(col_widths, row_heights, widths, heights, x_base, y_base):
+    '''
+    Loop form of _compute_cell_origins, compiled with numba when available.
+    '''
+    rows, cols = widths.shape
+    xs = np.empty((rows,cols))
+    ys = np.empty((rows,cols))
+
+    # Row bottoms, from the bottom (last) row up.
+    y = y_base
+    for i in range(rows-1,-1,-1):
+        x = x_base
+        for j in range(cols):
+            xs[i,j] = x + (col_widths[j]  - widths[i,j] )/2
+            ys[i,j] = y + (row_heights[i] - heights[i,j])/2
+            x += col_widths[j]
+        y += row_heights[i]
+
+    return xs, ys
+
+if numba is not None:
+    _compute_cell_origins_loop = numba.njit(cache=True)(_compute_cell_origins_loop)
+
 class Layout:
     '''
     Abstract Layout base class for GCode documents.
     '''
 
-    # References
-    _parent   = None
-    _children = None
+    __slots__ = ('_parents', '_children',
+                 '_padding_width', '_padding_height',
+                 '_x', '_y', '_z',
+                 '_header', '_footer',
+                 '_size_cache')
+
+    def __init__(self):
+        # References
+        # An object can be added to several layouts, all of which size from it.
+        self._parents  = []
+        self._children = None
+
+        # Padding for children
+        self._padding_width  = 0
+        self._padding_height = 0
 
-    # Padding for children
-    _padding_width  = 0
-    _padding_height = 0
+        # Layout origin. Defined to be lower left corner always.
+        self._x = None
+        self._y = None
+        self._z = None
 
-    # Layout origin. Defined to be lower left corner always.
-    _x = None
-    _y = None
-    _z = None
+        # Comments for cell
+        self._header = None
+        self._footer = None
 
-    # Comments for cell
-    _header = None
-    _footer = None
+        # Cached size, cleared when layout or children change.
+        self._size_cache = None
 
     @property
     def x(self)->float:
@@ -101,6 +196,7 @@ class Layout:
     @padding_width.setter
     def padding_width(self, value:float):
         self._padding_width = value
+        self._invalidate()
 
     @property
     def padding_height(self):
@@ -112,17 +208,21 @@ class Layout:
     @padding_height.setter
     def padding_height(self, value:float):
         self._padding_height = value
+        self._invalidate()
 
     @property
     def parent(self):
         '''
-        Parent object.
+        Parent object.  Most recently added, if in more than one layout.
         '''
-        return self._parent
+        return self._parents[-1] if self._parents else None
 
     @parent.setter
     def parent(self,value):
-        self._parent = value
+        if value is None:
+            self._parents = []
+        elif not any(p is value for p in self._parents):
+            self._parents.append(value)
 
     @property
     def header(self) -> str:
@@ -146,6 +246,16 @@ class Layout:
     def footer(self,value:str):
         self._footer = value
 
+    def _invalidate(self):
+        '''
+        Clears cached size of this layout and all parent layouts.
+        '''
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._size_cache = None
+            stack.extend(node._parents)
+
     def AddChild(self,child):
         '''
         Abstract method, add child layout or shape to this layout.
@@ -172,7 +282,23 @@ class Layout:
 
     def GCode(self,doc):
         '''
-        Generate G-Code for layout object.
+        Generate G-Code for layout object and all of its children.
+
+        Parameters:
+        doc: Doc
+            Document into which to inject generated G-Code.
+        '''
+        doc._emit(self)
+
+    def _gcode_enter(self,doc) -> list:
+        '''
+        Emits layout header and positions children for G-Code generation.
+
+        Returns
+        -------
+        items: list
+            Items to emit in order.  Each is either (child, (x, y)) for
+            a positioned child, or (comment, None) for a comment line.
 
         Raises
         ------
@@ -182,12 +308,21 @@ class Layout:
         # Emulating a pure virtual method that should have a concrete implementation.
         raise Exception(f'No GCode method defined for class: {type(self)}')
 
+    def _gcode_exit(self,doc):
+        '''
+        Emits layout footer once all children have been generated.
+        '''
+        if self.footer is not None:
+            doc.AddLine(f'({self.footer})')
+
 class CellLayout(Layout):
     '''
     Cell layout object. 
     Contains a single child and adds padding.
     '''
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -203,6 +338,9 @@ class CellLayout(Layout):
             Child object to store.        
         '''
         self._children = child
+        if child is not None:
+            child.parent = self
+        self._invalidate()
 
     def Size(self) -> tuple:
         '''
@@ -213,19 +351,23 @@ class CellLayout(Layout):
         size: tuple
             Object size: (width, height)
         '''
-        sz_w = 2*self.padding_width
-        sz_h = 2*self.padding_height
-        if self._children is not None:
-            sz_child = self._children.Size()
+        if self._size_cache is not None:
+            return self._size_cache
+
+        sz_w  = 2*self._padding_width
+        sz_h  = 2*self._padding_height
+        child = self._children
+        if child is not None:
+            sz_child = child.Size()
             sz_w += sz_child[0]
             sz_h += sz_child[1]
 
-        return (sz_w,sz_h)
+        self._size_cache = (sz_w,sz_h)
+        return self._size_cache
 
-    def GCode(self,doc):
+    def _gcode_enter(self,doc) -> list:
         '''
-        Generates G-Code for Cell and contents.
-        Cell child is called recusively.
+        Emits Cell header and positions the child.
 
         Parameters:
         doc: Doc
@@ -233,22 +375,19 @@ class CellLayout(Layout):
         '''
         
         # Add header comment
-        if self.header is not None:
-            doc.AddLine(f'({self.header})')
+        header = self._header
+        if header is not None:
+            doc.AddLine(f'({header})')
 
-        # Set child position
-        self._children.x = self.x + self.padding_width
-        self._children.y = self.y + self.padding_height
+        child = self._children
+        if child is None:
+            if doc._debug_comments:
+                return [('( *Empty Cell* )', None)]
+            return []
 
-        # Child GCode
-        if self._children is not None:
-            self._children.GCode(doc)
-        else:
-            doc.AddLine('( *Empty Cell* )')
-
-        # Generate GCode
-        if self.footer is not None:
-            doc.AddLine(f'({self.footer})')
+        # Child position
+        pos = (self._x + self._padding_width, self._y + self._padding_height)
+        return [(child, pos)]
 
 class GridLayout(Layout):
     '''
@@ -256,22 +395,17 @@ class GridLayout(Layout):
     Note that padding is applied to outside of grid.
     '''
 
-    # Grid size
-    _rows = None
-    _cols = None
-    _grid = None
-
-    # Sizing info
-    _widths  = None
-    _heights = None
-
-    # Cell child padding.
-    _cell_padding_width  = 0
-    _cell_padding_height = 0
+    __slots__ = ('_rows', '_cols', '_grid',
+                 '_widths', '_heights', '_col_widths', '_row_heights',
+                 '_cell_padding_width', '_cell_padding_height')
 
     def __init__(self,rows:int=2,columns:int=2):
         super().__init__()
 
+        # Cell child padding.
+        self._cell_padding_width  = 0
+        self._cell_padding_height = 0
+
         if rows < 1:
             raise ValueError('Must have at least 1 row.')
         if columns < 1:
@@ -280,11 +414,15 @@ class GridLayout(Layout):
         self._rows = rows
         self._cols = columns
 
-        # Intialize grid info
-        self._grid    = [[0] * columns for _ in range(rows)]
+        # Intialize grid info, empty cells are None.
+        self._grid    = np.full((rows,columns), None, dtype=object)
         self._widths  = np.zeros((rows,columns))
         self._heights = np.zeros((rows,columns))
 
+        # Column widths and row heights, set by Size().
+        self._col_widths  = np.zeros(columns)
+        self._row_heights = np.zeros(rows)
+
     @property 
     def cell_padding_width(self) -> float:
         '''
@@ -319,7 +457,7 @@ class GridLayout(Layout):
         '''
         Rectangular grid column count.
         '''
-        return self._columns
+        return self._cols
 
     def AddChild(self,child,row:int=0,column:int=0):
         '''
@@ -330,7 +468,9 @@ class GridLayout(Layout):
         if column < 0:
             raise ValueError('Column must be >= 0')
 
-        self._grid[row][column] = child
+        self._grid[row,column] = child
+        child.parent = self
+        self._invalidate()
 
     def AddChildCell(self,child,row:int=0,column:int=0):
         '''
@@ -354,138 +494,137 @@ class GridLayout(Layout):
         '''
         Return size of rectangular grid layout object.
         '''
-        # Process rows and columns, finding max width for each col, max height for each row.
-        for i,row in enumerate(self._grid):
-            for j,col in enumerate(row):
-                # Deal with empty cells
-                if isinstance(col,int):
-                    self._widths[i,j]  = 0
-                    self._heights[i,j] = 0
-                else:
-                    # Grid cell size.
-                    # Note that if they added a cell, this will include cell padding.
-                    sz = col.Size() 
-                    self._widths[i,j]  = sz[0]
-                    self._heights[i,j] = sz[1]
+        if self._size_cache is not None:
+            return self._size_cache
 
+        # Collect size of each grid cell, empty cells are zero sized.
+        # Note that if they added a cell, this will include cell padding.
+        sizes = [[(0,0) if col is None else col.Size() for col in row]
+                 for row in self._grid]
+        sizes = np.asarray(sizes, dtype=np.float64)
+        self._widths  = sizes[...,0]
+        self._heights = sizes[...,1]
+
+        # Max width for each col, max height for each row.
         # Sum for overall grid size
-        sz_width  = np.amax(self._widths,  axis=0).sum()
-        sz_height = np.amax(self._heights, axis=1).sum()
+        self._col_widths  = self._widths.max(axis=0)
+        self._row_heights = self._heights.max(axis=1)
+        sz_width  = self._col_widths.sum()
+        sz_height = self._row_heights.sum()
 
         # Pad
         sz_width  += self._padding_width
         sz_height += self._padding_height
 
-        return (sz_width,sz_height)
+        self._size_cache = (sz_width,sz_height)
+        return self._size_cache
 
-    def GCode(self,doc):
+    def _gcode_enter(self,doc) -> list:
         '''
-        Generate GCode for a rectangular grid layout.
+        Positions children of a rectangular grid layout.
         GCode is generated left to right, top to bottom.
         '''
         # Add header comment
-        if self.header is not None:
-            doc.AddLine(f'({self.header})')
+        header = self._header
+        if header is not None:
+            doc.AddLine(f'({header})')
 
         # Make sure we have cell sizes.
-        if not self._widths.any():
-            self.Size()
-        if not self._heights.any():
-            self.Size()
+        self.Size()
 
         # Base offset of all objects
-        x_base = self.x + self.padding_width
-        y_base = self.y + self.padding_height
-
-        # Column widths
-        widths = np.amax(self._widths,  axis=0)
-
-        # Row heights
-        heights = np.amax(self._heights, axis=1)
-
-        # Process rows and columns, finding max width for each col, max height for each row.
-        for i,row in enumerate(self._grid):
-            for j,col in enumerate(row):
+        x_base = self._x + self._padding_width
+        y_base = self._y + self._padding_height
+
+        # Object positions for all cells at once, centering each object in its cell.
+        xs, ys = _compute_cell_origins(self._col_widths, self._row_heights,
+                                       self._widths, self._heights,
+                                       float(x_base), float(y_base))
+
+        # Process rows and columns.
+        items  = []
+        append = items.append
+        grid   = self._grid
+        debug  = doc._debug_comments
+        for i in range(self._rows):
+            for j in range(self._cols):
+                col = grid[i,j]
 
                 # Index comment
-                doc.AddLine(f'(Grid cell {i},{j} )')
+                if debug:
+                    append((f'(Grid cell {i},{j} )', None))
 
-                if col == 0:
+                if col is None:
                     # Nothing in this grid cell.
                     # Note that and move on
-                    doc.AddLine('( *Empty Cell* )')
+                    if debug:
+                        append(('( *Empty Cell* )', None))
                     continue
 
-                # Cell lower left corner position.
-                x_offset = x_base + widths[0:j].sum()
-                y_offset = y_base + heights[i+1:].sum()
-
-                # Center the object
-                x_center_offset = (widths[j]  - self._widths[i,j] )/2
-                y_center_offset = (heights[i] - self._heights[i,j])/2
-
-                x_offset += x_center_offset
-                y_offset += y_center_offset
-
-                # Set its coordinates
-                col.x = x_offset
-                col.y = y_offset
-
-                # Child GCode
-                col.GCode(doc)
+                # Child with its coordinates
+                append((col, (xs[i,j], ys[i,j])))
 
-        # Generate GCode
-        if self.footer is not None:
-            doc.AddLine(f'({self.footer})')
+        return items
 
 class Doc:
     '''
     Print job document.
     Contains document and device configuration information.
     '''
-    # Document origin. Defined to be lower left corner always.
-    # Allows document to be placed in workspace.
-    _x = 0
-    _y = 0
-    _z = 0
 
-    # Laser Properties
-    _laser_on  = 'M4'  # M3 for consant power regardless of speed.  M4 compensates for speed.
-    _laser_off = 'M5'  # Default for Grbl
-    _laser_power = 0   # Percentage
-    _laser_power_default = 20  # Percentage.  Default value for document.
-    _device_laser_max    = 1000 # Maximum laser power value to use, in machine units.  Set for Sainsmart laser.
- 
-    # Device retraction
-    _z_retract_enabled = False
-    _z_retract_height  = None
+    __slots__ = ('_x', '_y', '_z',
+                 '_laser_on', '_laser_off', '_laser_power',
+                 '_laser_power_default', '_device_laser_max',
+                 '_laser_on_cache', '_laser_off_cache',
+                 '_z_retract_enabled', '_z_retract_height',
+                 '_speed_position', '_speed_print',
+                 '_EOL', '_code_chunks', '_code_cache', '_header', '_footer',
+                 '_layout', '_job_control', '_debug_comments')
+
+    def __init__(self,job_control:bool=True):
+
+        # Document origin. Defined to be lower left corner always.
+        # Allows document to be placed in workspace.
+        self._x = 0
+        self._y = 0
+        self._z = 0
 
-    # Positioning speed
-    _speed_position = 3000.0  # We'll assume mm units.
+        # Laser Properties
+        self._laser_on  = 'M4'  # M3 for consant power regardless of speed.  M4 compensates for speed.
+        self._laser_off = 'M5'  # Default for Grbl
+        self._laser_power_default = 20  # Percentage.  Default value for document.
+        self._device_laser_max    = 1000 # Maximum laser power value to use, in machine units.  Set for Sainsmart laser.
 
-    # Printing speed
-    _speed_print = 500.0
+        # Set laser power to default.
+        self._laser_power = self._laser_power_default  # Percentage
 
-    # End of line character
-    _EOL = '\n'
+        # Rendered laser on/off G-code.
+        # Laser on is keyed by power since shapes switch power often.
+        self._laser_on_cache  = {}
+        self._laser_off_cache = None
 
-    # Generated G-code
-    _code = ''
+        # Device retraction
+        self._z_retract_enabled = False
+        self._z_retract_height  = None
 
-    # Document comments
-    _header = ''
-    _footer = ''
+        # Positioning speed
+        self._speed_position = 3000.0  # We'll assume mm units.
 
-    # Document layout
-    _layout = None
+        # Printing speed
+        self._speed_print = 500.0
 
-    # Add job control
-    _job_control = True
+        # End of line character
+        self._EOL = '\n'
 
-    def __init__(self,job_control:bool=True):
+        # Generated G-code.
+        # Written as a list of string chunks, joined on demand
+        # and cached until the next write.
+        self._code_chunks = []
+        self._code_cache  = None
 
-        # Set laser power to default.
-        self._laser_power = self._laser_power_default
+        # Document comments
+        self._header = ''
+        self._footer = ''
 
         # Set layout
         self._layout = CellLayout()
@@ -493,6 +632,9 @@ class Doc:
         # Job control
         self._job_control = job_control
 
+        # Per cell and per shape comments
+        self._debug_comments = False
+
     @property
     def x(self)->float:
         return(self._x)
@@ -595,11 +737,17 @@ class Doc:
         '''
         Document G-Code buffer.
         '''
-        return self._code
+        if self._code_cache is None:
+            self._code_cache = ''.join(self._code_chunks)
+        return self._code_cache
 
     @code.setter
     def code(self,value:str):
-        self._code = value
+        if value:
+            self._code_chunks = [value]
+        else:
+            self._code_chunks = []
+        self._code_cache = None
 
     @property
     def laser_on(self) -> str:
@@ -612,6 +760,10 @@ class Doc:
         Getter returns laser on G-code setting power to current power level.
         '''
 
+        code = self._laser_on_cache.get(self._laser_power)
+        if code is not None:
+            return code
+
         code  = self._laser_on
         code += f' S{(self._laser_power/100)*self._device_laser_max}'
 
@@ -620,6 +772,7 @@ class Doc:
         else:
             code += f' (Laser on @ 100%)'
 
+        self._laser_on_cache[self._laser_power] = code
         return  code
 
     @laser_on.setter
@@ -631,19 +784,23 @@ class Doc:
             raise ValueError(f'Laser on G-code must be either M3 or M4, not: {value}')
 
         self._laser_on = value
+        self._laser_on_cache.clear()
 
     @property
     def laser_off(self) -> str:
         '''
         Laser off G-Code.
         '''
-        return self._laser_off + '        (Laser off)'
+        if self._laser_off_cache is None:
+            self._laser_off_cache = self._laser_off + '        (Laser off)'
+        return self._laser_off_cache
 
     @laser_off.setter
     def laser_off(self,value:str):
         value = value.upper()
         value = value.strip()
         self._laser_off = value
+        self._laser_off_cache = None
 
     @property
     def laser_power(self) -> float:
@@ -692,6 +849,7 @@ class Doc:
             raise ValueError('Device laser maximum value must be positive.')
 
         self._device_laser_max = value
+        self._laser_on_cache.clear()
 
     @property
     def header(self) -> str:
@@ -722,22 +880,79 @@ class Doc:
         '''
         return self._layout
 
+    @property
+    def debug_comments(self) -> bool:
+        '''
+        If True, emit grid cell, empty cell and shape header/footer comments.
+        Off by default to keep generated files small.
+        '''
+        return self._debug_comments
+
+    @debug_comments.setter
+    def debug_comments(self,value:bool):
+        self._debug_comments = bool(value)
+
     def AddLine(self,line:str=''):
         '''
         Adds a line to the document.
         '''
-        self.code += line + self.EOL
+        self._code_chunks.append(line)
+        self._code_chunks.append(self._EOL)
+        self._code_cache = None
+
+    def _add_comment(self,text:str):
+        '''
+        Adds possibly multi-line text as one comment per line.
+        '''
+        code = self._code_chunks
+        eol  = self._EOL
+        for line in text.split(eol):
+            code.append('(')
+            code.append(line)
+            code.append(')')
+            code.append(eol)
+        self._code_cache = None
+
+    def _emit(self,root):
+        '''
+        Generates G-Code for a layout tree.
+        Uses an explicit stack rather than recursion, so deeply nested
+        layouts do not grow the Python call stack.
+        '''
+        stack = [(root, None)]
+        while stack:
+            node, pos = stack.pop()
+            if isinstance(node, str):
+                # Comment line from a layout.
+                self.AddLine(node)
+            elif pos is _EXIT:
+                node._gcode_exit(self)
+            else:
+                if pos is not None:
+                    node.x, node.y = pos
+
+                if isinstance(node, Layout):
+                    items = node._gcode_enter(self)
+                    stack.append((node, _EXIT))
+                    stack.extend(reversed(items))
+                elif type(node).GCode is Shape.GCode:
+                    # Emit without joining the document G-Code per shape.
+                    node._gcode_emit(self)
+                else:
+                    # Subclass with its own GCode.
+                    node.GCode(self)
 
     def Save(self,filename):
         '''
         Save generated GCode to file.
         '''
-        if len(self.code) == 0:
+        if not self._code_chunks:
             # Generate GCode
             self.GCode()
 
-        with open(filename,'w') as fp:
-            fp.write(self.code)
+        # Stream chunks through a large write buffer.
+        with open(filename,'w',buffering=1<<20) as fp:
+            fp.writelines(self._code_chunks)
 
     def Size(self) -> tuple:
         '''
@@ -755,9 +970,7 @@ class Doc:
 
         # Header
         if len(self._header) > 0:
-            header = self._header
-            header = header.replace(self.EOL,')'+self.EOL+'(')
-            self.code += f'({header})' + self.EOL
+            self._add_comment(self._header)
 
         # Prerequisites
         if self._job_control:
@@ -772,7 +985,7 @@ class Doc:
         self._layout.x = self.x
         self._layout.y = self.y
         self._layout.z = self.z
-        self._layout.GCode(self)
+        self._emit(self._layout)
 
         # Go home
         # self.AddLine('')
@@ -784,11 +997,11 @@ class Doc:
 
         # End document
         if self._job_control:
-            self.code += self.EOL 
-            self.code += 'M2' + ' (End Document)' + self.EOL
+            self.AddLine()
+            self.AddLine('M2' + ' (End Document)')
 
         if len(self._footer) > 0:
-            self.code += f'({self._footer})' + self.EOL
+            self._add_comment(self._footer)
 
         # Save the file if they gave us a file name.
         if filename is not None:
@@ -799,25 +1012,12 @@ class Shape:
     Abstract base class for drawing G-code shapes.
     All coordinate value are absolute.
     '''
-    # Shape origin.
-    # Defined to be lower left corner always.
-    _x = None
-    _y = None
-    _z = None
-
-    # Set speeds
-    _speed_print = None
 
-    # Laser power
-    _laser_power = None
-
-    # Multi pass
-    _passes   = 1
-    _stepdown = None
-
-    # Comments
-    _header = None
-    _footer = None
+    __slots__ = ('_x', '_y', '_z',
+                 '_speed_print', '_laser_power',
+                 '_passes', '_stepdown',
+                 '_header', '_footer',
+                 '_parents')
 
     def __init__(self,x:float=0.0,y:float=0.0,z:float=0.0, speed_print:float=None, laser_power=None):
         '''
@@ -825,14 +1025,53 @@ class Shape:
         If speed_print is not set, the document default value will be used.
         '''
 
+        # Shape origin.
+        # Defined to be lower left corner always.
+        self._x = None
+        self._y = None
+        self._z = None
+
+        # Multi pass
+        self._passes   = 1
+        self._stepdown = None
+
+        # Comments
+        self._header = None
+        self._footer = None
+
+        # Containing layouts
+        self._parents = []
+
         self.x = x
         self.y = y
         self.z = z
 
+        # Set speeds
         self._speed_print = speed_print
+
+        # Laser power
         self._laser_power = laser_power
 
-    def GCode(self,doc:Doc) -> str:
+    def _resolve(self,doc:Doc) -> tuple:
+        '''
+        Resolves shape settings against document defaults.
+        Sets the document laser power to the shape power if specified.
+
+        Returns
+        -------
+        settings: tuple
+            (print speed, laser on G-code)
+        '''
+        speed = self._speed_print
+        if speed is None:
+            speed = doc._speed_print
+
+        if self._laser_power is not None:
+            doc.laser_power = self._laser_power
+
+        return (speed, doc.laser_on)
+
+    def _gcode_preamble(self,doc:Doc) -> tuple:
         '''
         Inserts a shape G-code preamble into the document.
 
@@ -840,28 +1079,55 @@ class Shape:
         ----------
         doc: Doc
             Document into which to inject generated G-Code.
+
+        Returns
+        -------
+        settings: tuple
+            Resolved (print speed, laser on G-code) for the shape.
         '''
+        settings = self._resolve(doc)
 
-        if self._header is not None:
+        if self._header is not None and doc._debug_comments:
             doc.AddLine(f'({self._header})')
 
         # Retract Z-axis if needed.
         if doc.z_retract_enabled:
-            doc.AddLine(f'G0 Z{doc.z_retract_height:0.3f} F{doc.speed_position:0.1f}')
+            doc.AddLine(_FMT_G0_Z_F % (doc.z_retract_height, doc.speed_position))
 
         # Go to XY coordinate.
-        doc.AddLine(f'G0 X{self.x:0.3f} Y{self.y:0.3f} F{doc.speed_position:0.1f}')
+        doc.AddLine(_FMT_G0_XY_F % (self.x, self.y, doc.speed_position))
 
         # Set Z-axis positioning
         # Separate line in case we needed to lift to get to the XY pos.
-        doc.AddLine(f'G0 Z{self.z:0.3f}')
+        doc.AddLine(_FMT_G0_Z % self.z)
 
-        # Set print speed, using default if needed.
-        if self.speed_print is None:
-            doc.AddLine(f'G1 F{doc.speed_print:0.1f}')
-        else:
-            doc.AddLine(f'G1 F{self.speed_print:0.1f}')
+        # Set print speed.
+        doc.AddLine(_FMT_G1_F % settings[0])
+
+        return settings
+
+    def _gcode_emit(self,doc:Doc):
+        '''
+        Emits the shape G-code into the document.
+        Shapes override this, Doc calls it for every shape in a layout.
+        '''
+        self._gcode_preamble(doc)
+
+    def GCode(self,doc:Doc) -> str:
+        '''
+        Generates G-Code for the shape.
+
+        Parameters
+        ----------
+        doc: Doc
+            Document into which to inject generated G-Code.
 
+        Returns
+        -------
+        code: str
+            Document G-Code.
+        '''
+        self._gcode_emit(doc)
         return doc.code
 
     @property
@@ -976,6 +1242,27 @@ class Shape:
     def footer(self,value:str):
         self._footer = value
 
+    @property
+    def parent(self):
+        '''
+        Parent layout object.  Most recently added, if in more than one layout.
+        '''
+        return self._parents[-1] if self._parents else None
+
+    @parent.setter
+    def parent(self,value):
+        if value is None:
+            self._parents = []
+        elif not any(p is value for p in self._parents):
+            self._parents.append(value)
+
+    def _invalidate(self):
+        '''
+        Shape size changed, clear cached size of parent layouts.
+        '''
+        for parent in self._parents:
+            parent._invalidate()
+
     def Size(self) -> tuple:
         '''
         Returns tuple of bounding box size of object.
@@ -989,8 +1276,7 @@ class Line(Shape):
     Simple line.
     '''
 
-    _length     = None
-    _angle_deg  = None
+    __slots__ = ('_length', '_angle_deg', '_cos', '_sin')
 
     def __init__(self,x:float=0.0, y:float=0.0, z:float=0.0, 
                  length:float=1, angle_deg:float=0,
@@ -1010,6 +1296,11 @@ class Line(Shape):
 
         super().__init__(x=x, y=y, speed_print=speed_print, laser_power=laser_power)
 
+        self._length    = None
+        self._angle_deg = None
+        self._cos       = None
+        self._sin       = None
+
         self.length     = length
         self.angle_deg  = angle_deg
 
@@ -1031,6 +1322,7 @@ class Line(Shape):
             raise ValueError("Length must be positive.")
 
         self._length = value
+        self._invalidate()
 
     @property
     def angle(self) -> float:
@@ -1043,6 +1335,27 @@ class Line(Shape):
     def angle(self, value:float):
         self._angle_deg = value
 
+        # Direction unit vector.
+        # Exact for axis aligned lines to keep FP noise out of the output.
+        unit = _AXIS_UNIT.get(value % 360)
+        if unit is None:
+            theta = math.radians(value)
+            unit  = (math.cos(theta), math.sin(theta))
+        self._cos, self._sin = unit
+
+        self._invalidate()
+
+    @property
+    def angle_deg(self) -> float:
+        '''
+        Alias for angle.
+        '''
+        return self.angle
+
+    @angle_deg.setter
+    def angle_deg(self, value:float):
+        self.angle = value
+
     def Size(self) -> tuple:
         '''
         Return size of Line shape object.
@@ -1057,12 +1370,11 @@ class Line(Shape):
             Object size: (width, height)
         '''
         
-        theta = math.radians(self.angle_deg)
-        sz = (self.length*math.cos(theta), 
-                self.length*math.sin(theta))
+        sz = (self._length*self._cos,
+              self._length*self._sin)
         return sz
 
-    def GCode(self, doc: Doc) -> str:
+    def _gcode_emit(self, doc: Doc):
         '''
         Generates G-Code for Line shape.
 
@@ -1073,38 +1385,30 @@ class Line(Shape):
         '''
 
         # Shape preamble, handles shape header.
-        super().GCode(doc)
-
-        # Set shape specific power if specified
-        if self.laser_power is not None:
-            doc.laser_power = self.laser_power
+        _, laser_on = self._gcode_preamble(doc)
 
         # Laser on
-        doc.AddLine(doc.laser_on)
+        doc.AddLine(laser_on)
 
         # Draw our line.
-        theta = math.radians(self.angle_deg)
-        x = self.length * math.cos(theta)
-        y = self.length * math.sin(theta)
-        doc.AddLine(f'G1 X{self.x+x:0.3f} Y{self.y + y:0.3f}')
+        x = self._length * self._cos
+        y = self._length * self._sin
+        doc.AddLine(_FMT_G1_XY % (self.x + x, self.y + y))
 
         # Laser off & return to default power.
         doc.AddLine(doc.laser_off)
         doc.laser_power = doc.laser_power_default
 
         # Footer
-        if self._footer is not None:
+        if self._footer is not None and doc._debug_comments:
             doc.AddLine(f'({self._footer})')
 
-        return doc.code
-
 class Rectangle(Shape):
     '''
     Draws a rectangle.
     '''
 
-    _width  = None
-    _height = None
+    __slots__ = ('_width', '_height')
 
     def __init__(self,x:float=0.0, y:float=0.0, width:float=1.0, height:float=1.0, speed_print:float=None, laser_power=None):
         '''
@@ -1113,10 +1417,13 @@ class Rectangle(Shape):
 
         super().__init__(x=x, y=y, speed_print=speed_print, laser_power=laser_power)
 
+        self._width  = None
+        self._height = None
+
         self.height = height
         self.width  = width
 
-    def GCode(self,doc:Doc):
+    def _gcode_emit(self,doc:Doc):
         '''
         Generate G-Code for rectangle object.
 
@@ -1127,31 +1434,27 @@ class Rectangle(Shape):
         '''
 
         # Shape preamble, handles shape header.
-        super().GCode(doc)
-
-        # Set shape specific power if specified
-        if self.laser_power is not None:
-            doc.laser_power = self.laser_power
+        _, laser_on = self._gcode_preamble(doc)
 
         # Laser on
-        doc.AddLine(doc.laser_on)
+        doc.AddLine(laser_on)
 
         # Draw our four lines.
-        doc.AddLine(f'G1 X{self.x:0.3f} Y{self.y + self.height:0.3f} (Left)')
-        doc.AddLine(f'G1 X{self.x + self.width:0.3f} Y{self.y + self.height:0.3f} (Top)')
-        doc.AddLine(f'G1 X{self.x + self.width:0.3f} Y{self.y:0.3f} (Right)')
-        doc.AddLine(f'G1 X{self.x:0.3f} Y{self.y:0.3f} (Bottom)')
+        x0  = self._x
+        y0  = self._y
+        x1  = x0 + self._width
+        y1  = y0 + self._height
+        eol = doc.EOL
+        doc.AddLine(_FMT_RECT % (x0, y1, eol, x1, y1, eol, x1, y0, eol, x0, y0))
 
         # Laser off & return to default power.
         doc.AddLine(doc.laser_off)
         doc.laser_power = doc.laser_power_default
 
         # Footer
-        if self._footer is not None:
+        if self._footer is not None and doc._debug_comments:
             doc.AddLine(f'({self._footer})')
 
-        return doc.code
-
     @property
     def width(self) -> float:
         return(self._width)
@@ -1165,6 +1468,7 @@ class Rectangle(Shape):
             raise ValueError("Width must be positive.")
 
         self._width = width
+        self._invalidate()
   
     @property
     def height(self):
@@ -1179,10 +1483,1352 @@ class Rectangle(Shape):
             raise ValueError("Height must be positive.")
 
         self._height = height
+        self._invalidate()
 
     def Size(self) -> tuple:
         return (self.width,self.height)
 
+class TextCommand(IntEnum):
+    '''
+    Text operation codes.
+    Laser and speed commands are replaced when G-code is generated.
+    '''
+    POINT   = 0
+    OFF     = 1
+    ON      = 2
+    FAST    = 3
+    SLOW    = 4
+    COMMENT = 5
+
+# Character glyphs.
+# Each glyph is a sequence of commands and (x,y) points on a 9 unit tall grid
+# with the character's left edge at x=0.  Commands are comment strings or
+# TextCommand laser and speed codes.
+_ON   = TextCommand.ON
+_OFF  = TextCommand.OFF
+_FAST = TextCommand.FAST
+_SLOW = TextCommand.SLOW
+
+def _glyph_arrays(glyph):
+    '''
+    Converts a glyph to point and command code arrays.
+    Command entries have NaN points.
+
+    Returns
+    -------
+    arrays: tuple
+        (xy, cmds, comments) where comments is a list of (index, text).
+    '''
+    xy       = []
+    cmds     = []
+    comments = []
+    for item in glyph:
+        if isinstance(item,tuple):
+            xy.append(item)
+            cmds.append(TextCommand.POINT)
+        elif isinstance(item,str):
+            comments.append((len(cmds), item))
+            xy.append((math.nan, math.nan))
+            cmds.append(TextCommand.COMMENT)
+        else:
+            xy.append((math.nan, math.nan))
+            cmds.append(item)
+
+    xy   = np.array(xy, dtype=np.float64).reshape(-1,2)
+    cmds = np.array(cmds, dtype=np.int8)
+    return (xy, cmds, comments)
+
+def _build_atlas(table):
+    '''
+    Packs the glyphs of a character table into a single font atlas.
+
+    Parameters
+    ----------
+    table: dict
+        Maps character to (glyph, x advance).
+
+    Returns
+    -------
+    atlas: tuple
+        (xy, cmds, index) where xy and cmds hold the arrays of all glyphs
+        back to back, and index maps each character to
+        (start, length, x advance, comments) of its glyph in the atlas.
+        Glyph coordinates are small grid values, points are stored as float32.
+    '''
+    xy    = []
+    cmds  = []
+    index = {}
+    start = 0
+    for char,(glyph,advance) in table.items():
+        g_xy, g_cmds, g_comments = _glyph_arrays(glyph)
+        xy.append(g_xy)
+        cmds.append(g_cmds)
+        index[char] = (start, len(g_cmds), advance, g_comments)
+        start += len(g_cmds)
+
+    return (np.concatenate(xy).astype(np.float32), np.concatenate(cmds), index)
+
+# Point count from which the numba point transform kernel is used when numba
+# is installed.  Ordinary labels use NumPy and never trigger a compile.
+_NUMBA_MIN_POINTS = 10000
+
+def _transform_points(pts, a, b, c, d):
+    '''
+    Applies the linear transform [[a,b],[c,d]] to (N,2) points, then shifts
+    the points so their bounding box lower left corner is at (0,0).
+
+    Returns (points, width, height).
+    '''
+    if numba is not None and len(pts) >= _NUMBA_MIN_POINTS:
+        return _transform_points_loop(pts, a, b, c, d)
+
+    if len(pts) == 0:
+        return pts.copy(), 0.0, 0.0
+
+    if b == 0 and c == 0:
+        # Unrotated, scale only.
+        out = pts * (a, d)
+    else:
+        out = pts @ np.array([[a, c],
+                              [b, d]])
+    out -= out.min(axis=0)
+    width, height = out.max(axis=0).tolist()
+    return out, width, height
+
+def _transform_points_loop(pts, a, b, c, d):
+    '''
+    Loop form of _transform_points, compiled with numba when available.
+    '''
+    n   = pts.shape[0]
+    out = np.empty((n,2))
+    if n == 0:
+        return out, 0.0, 0.0
+
+    x_min = y_min =  np.inf
+    x_max = y_max = -np.inf
+    for i in range(n):
+        x = pts[i,0]
+        y = pts[i,1]
+        nx = a*x + b*y
+        ny = c*x + d*y
+        out[i,0] = nx
+        out[i,1] = ny
+        x_min = min(x_min, nx)
+        x_max = max(x_max, nx)
+        y_min = min(y_min, ny)
+        y_max = max(y_max, ny)
+
+    for i in range(n):
+        out[i,0] -= x_min
+        out[i,1] -= y_min
+
+    return out, x_max - x_min, y_max - y_min
+
+if numba is not None:
+    _transform_points_loop = numba.njit(cache=True)(_transform_points_loop)
+
+#  .o88b. db   db  .d8b.  d8888b.  .d8b.   .o88b. d888888b d88888b d8888b. .d8888.
+# d8P  Y8 88   88 d8' `8b 88  `8D d8' `8b d8P  Y8 `~~88~~' 88'     88  `8D 88'  YP
+# 8P      88ooo88 88ooo88 88oobY' 88ooo88 8P         88    88ooooo 88oobY' `8bo.
+# 8b      88~~~88 88~~~88 88`8b   88~~~88 8b         88    88~~~~~ 88`8b     `Y8b.
+# Y8b  d8 88   88 88   88 88 `88. 88   88 Y8b  d8    88    88.     88 `88. db   8D
+#  `Y88P' YP   YP YP   YP 88   YD YP   YP  `Y88P'    YP    Y88888P 88   YD `8888Y'
+
+# Space, nothing to draw.
+_GLYPH_SPACE = ()
+
+#           .   .
+#       .           .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .   .   .   .   .   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+_GLYPH_A = (
+    "(Character: A)",
+    _ON,
+    _SLOW,
+    (0, 0),
+    (0, 7),
+    (1, 8),
+    (2, 9),
+    (3, 9),
+    (4, 8),
+    (5, 7),
+    (5, 0),
+    _OFF,
+    _FAST,
+    (5, 4),
+    _ON,
+    _SLOW,
+    (0, 4),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .
+#   .               .
+#   .                   .
+#   .                   .
+#   .               .
+#   .   .   .   .
+#   .               .
+#   .                   .
+#   .                   .
+#   .   .   .   .   .
+_GLYPH_B = (
+    "(Character: B)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    (3, 9),
+    (4, 8),
+    (5, 7),
+    (5, 6),
+    (4, 5),
+    (3, 4),
+    (0, 4),
+    _OFF,
+    _FAST,
+    (3, 4),
+    _ON,
+    _SLOW,
+    (4, 3),
+    (5, 2),
+    (5, 1),
+    (4, 0),
+    (0, 0),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .   .
+#   .                   .
+#   .
+#   .
+#   .
+#   .
+#   .
+#   .
+#   .                   .
+#       .   .   .   .
+_GLYPH_C = (
+    "(Character: C)",
+    _FAST,
+    (0, 0),
+    _OFF,
+    _FAST,
+    (5, 1),
+    _ON,
+    _SLOW,
+    (4, 0),
+    (1, 0),
+    (0, 1),
+    (0, 8),
+    (1, 9),
+    (4, 9),
+    (5, 8),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .
+#   .               .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .               .
+#   .   .   .   .
+_GLYPH_D = (
+    "(Character: D)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    (3, 9),
+    (4, 8),
+    (5, 7),
+    (5, 2),
+    (4, 1),
+    (3, 0),
+    (0, 0),
+    (0, 9),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .   .   .
+#   .
+#   .
+#   .
+#   .   .   .   .   .   .
+#   .
+#   .
+#   .
+#   .
+#   .   .   .   .   .   .
+_GLYPH_E = (
+    "(Character: E)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    (5, 9),
+    _OFF,
+    _FAST,
+    (5, 5),
+    _ON,
+    _SLOW,
+    (0, 5),
+    _OFF,
+    _FAST,
+    (5, 0),
+    _ON,
+    _SLOW,
+    (0, 0),
+    (0, 9),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .   .   .
+#   .
+#   .
+#   .
+#   .
+#   .   .   .   .   .   .
+#   .
+#   .
+#   .
+#   .
+_GLYPH_F = (
+    "(Character: F)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    (5, 9),
+    _OFF,
+    _FAST,
+    (5, 5),
+    _ON,
+    _SLOW,
+    (0, 5),
+    _OFF,
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .   .
+#   .                   .
+#   .
+#   .
+#   .
+#   .               .   .
+#   .                   .
+#   .                   .
+#   .                   .
+#       .   .   .   .
+_GLYPH_G = (
+    "(Character: G)",
+    _OFF,
+    _FAST,
+    (5, 8),
+    _ON,
+    _SLOW,
+    (4, 9),
+    (1, 9),
+    (0, 8),
+    (0, 1),
+    (1, 0),
+    (4, 0),
+    (5, 1),
+    (5, 4),
+    (4, 4),
+    _OFF,
+    _FAST,
+)
+
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .   .   .   .   .   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+_GLYPH_H = (
+    "(Character: H)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    _OFF,
+    _FAST,
+    (5, 9),
+    _ON,
+    _SLOW,
+    (5, 0),
+    _OFF,
+    _FAST,
+    (0, 5),
+    _ON,
+    _SLOW,
+    (5, 5),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .   .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#   .   .   .   .   .
+_GLYPH_I = (
+    "(Character: I)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (4, 0),
+    _OFF,
+    _FAST,
+    (4, 9),
+    _ON,
+    _SLOW,
+    (0, 9),
+    _OFF,
+    _FAST,
+    (2, 9),
+    _ON,
+    _SLOW,
+    (2, 0),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .   .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#   .   .
+_GLYPH_J = (
+    "(Character: J)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (1, 0),
+    (2, 1),
+    (2, 9),
+    (0, 9),
+    _OFF,
+    _FAST,
+    (2, 9),
+    _ON,
+    _SLOW,
+    (4, 9),
+    _OFF,
+    _FAST,
+)
+
+#   .                   .
+#   .                   .
+#   .                   .
+#   .               .
+#   .           .
+#   .   .   .
+#   .           .
+#   .               .
+#   .                   .
+#   .                   .
+_GLYPH_K = (
+    "(Character: K)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    _OFF,
+    _FAST,
+    (5, 9),
+    _ON,
+    _SLOW,
+    (5, 7),
+    (4, 6),
+    (3, 5),
+    (2, 4),
+    (1, 4),
+    (0, 4),
+    (2, 4),
+    (3, 3),
+    (4, 2),
+    (5, 1),
+    (5, 0),
+    _OFF,
+    _FAST,
+)
+
+#   .
+#   .
+#   .
+#   .
+#   .
+#   .
+#   .
+#   .
+#   .
+#   .   .   .   .   .   .
+_GLYPH_L = (
+    "(Character: L)",
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (0, 0),
+    (5, 0),
+    _OFF,
+    _FAST,
+)
+
+#   .                       .
+#   .   .               .   .
+#   .       .       .       .
+#   .           .           .
+#   .           .           .
+#   .                       .
+#   .                       .
+#   .                       .
+#   .                       .
+#   .                       .
+_GLYPH_M = (
+    "(Character: M)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    (1, 8),
+    (2, 7),
+    (3, 6),
+    (3, 5),
+    (3, 6),
+    (4, 7),
+    (5, 8),
+    (6, 9),
+    (6, 0),
+    _OFF,
+    _FAST,
+)
+
+#   .                   . APROXIMATE, letting the cnc handle this movement
+#   . .                 .
+#   .   .               .
+#   .      .            .
+#   .                   .
+#   .        .          .
+#   .                   .
+#   .          .        .
+#   .             .     .
+#   .                .  .
+_GLYPH_N = (
+    "(Character: N)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 9),
+    (5, 0),
+    (5, 9),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#       .   .   .   .
+_GLYPH_O = (
+    "(Character: O)",
+    _FAST,
+    (0, 1),
+    _ON,
+    _SLOW,
+    (0, 8),
+    (1, 9),
+    (4, 9),
+    (5, 8),
+    (5, 1),
+    (4, 0),
+    (1, 0),
+    (0, 1),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .   .   .   .   .
+#   .
+#   .
+#   .
+#   .
+_GLYPH_P = (
+    "(Character: P)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 8),
+    (1, 9),
+    (4, 9),
+    (5, 8),
+    (5, 5),
+    (4, 4),
+    (0, 4),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .               .
+#       .   .   .       .
+_GLYPH_Q = (
+    "(Character: Q)",
+    _FAST,
+    (0, 1),
+    _ON,
+    _SLOW,
+    (0, 8),
+    (1, 9),
+    (4, 9),
+    (5, 8),
+    (5, 2),
+    (4, 1),
+    (5, 0),
+    _OFF,
+    _FAST,
+    (4, 1),
+    _ON,
+    _SLOW,
+    (3, 0),
+    (1, 0),
+    (0, 1),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .
+#   .               .
+#   .                   .
+#   .                   .
+#   .               .
+#   .   .   .   .
+#   .               .
+#   .                   .
+#   .                   .
+#   .                   .
+_GLYPH_R = (
+    "(Character: R)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (0, 8),
+    (1, 9),
+    (3, 9),
+    (4, 8),
+    (5, 7),
+    (5, 6),
+    (4, 5),
+    (3, 4),
+    (0, 4),
+    _OFF,
+    _FAST,
+    (3, 4),
+    _ON,
+    _SLOW,
+    (4, 3),
+    (5, 2),
+    (5, 0),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .   .   .
+#   .
+#   .
+#   .
+#   .
+#       .   .   .   .
+#                       .
+#                       .
+#                       .
+#   .   .   .   .   .
+_GLYPH_S = (
+    "(Character: S)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (4, 0),
+    (5, 1),
+    (5, 3),
+    (4, 4),
+    (1, 4),
+    (0, 5),
+    (0, 8),
+    (1, 9),
+    (5, 9),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .   .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+_GLYPH_T = (
+    "(Character: T)",
+    _FAST,
+    (2, 0),
+    _ON,
+    _SLOW,
+    (2, 9),
+    _OFF,
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (4, 9),
+    _OFF,
+    _FAST,
+)
+
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#   .                   .
+#       .   .   .   .
+_GLYPH_U = (
+    "(Character: U)",
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (0, 1),
+    (1, 0),
+    (4, 0),
+    (5, 1),
+    (5, 9),
+    _OFF,
+    _FAST,
+)
+
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#   .               . this one is also
+#   .               . interpolated as top left
+#   .               . bottom middle top right
+#   .               .
+#       .       .
+#           .
+_GLYPH_V = (
+    "(Character: V)",
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (2, 0),
+    (4, 9),
+    _OFF,
+    _FAST,
+)
+
+#   0   1   2   3   4  5
+#9  o       o       o
+#8
+#7
+#6
+#5
+#4
+#3
+#2
+#1
+#0       o       o
+_GLYPH_W = (
+    "(Character: W)",
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (2, 0),
+    (3, 9),
+    (4, 0),
+    (6, 9),
+    _OFF,
+    _FAST,
+)
+
+# once again, gonna be interpolation
+#   .               .
+#
+#
+#
+#
+#           .
+#
+#
+#
+#   .               .
+_GLYPH_X = (
+    "(Character: X)",
+    _FAST,
+    (0, 0),
+    _ON,
+    _SLOW,
+    (4, 9),
+    _OFF,
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (4, 0),
+    _OFF,
+    _FAST,
+)
+
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#       .       .
+#           .
+#           .
+#           .
+#           .
+#           .
+_GLYPH_Y = (
+    "(Character: Y)",
+    _FAST,
+    (2, 0),
+    _ON,
+    _SLOW,
+    (2, 4),
+    (0, 6),
+    (0, 9),
+    _OFF,
+    _FAST,
+    (4, 9),
+    _ON,
+    _SLOW,
+    (4, 6),
+    (2, 4),
+    _OFF,
+    _FAST,
+)
+
+# more point to point interpolation? yeah lmao
+#   .                   .
+#
+#
+#
+#
+#
+#
+#
+#
+#   .                   .
+_GLYPH_Z = (
+    "(Character: Z)",
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (5, 9),
+    (0, 0),
+    (5, 0),
+    _OFF,
+    _FAST,
+)
+
+# d8b   db db    db .88b  d88. d8888b. d88888b d8888b. .d8888.
+# 888o  88 88    88 88'YbdP`88 88  `8D 88'     88  `8D 88'  YP
+# 88V8o 88 88    88 88  88  88 88oooY' 88ooooo 88oobY' `8bo.
+# 88 V8o88 88    88 88  88  88 88~~~b. 88~~~~~ 88`8b     `Y8b.
+# 88  V888 88b  d88 88  88  88 88   8D 88.     88 `88. db   8D
+# VP   V8P ~Y8888P' YP  YP  YP Y8888P' Y88888P 88   YD `8888Y'
+
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+#           .
+_GLYPH_1 = (
+    "(Character: 1)",
+    _FAST,
+    (2, 0),
+    _ON,
+    _SLOW,
+    (2, 9),
+    _OFF,
+    _FAST,
+)
+
+#           .
+#   .               .
+#
+#
+#
+#
+#
+#
+#
+#   .   .   .   .   .
+_GLYPH_2 = (
+    "(Character: 2)",
+    _FAST,
+    (4, 0),
+    _ON,
+    _SLOW,
+    (0, 0),
+    (4, 8),
+    (2, 9),
+    (0, 8),
+    _OFF,
+    _FAST,
+)
+
+#           .
+#   .               .
+#                   .
+#                   .
+#   .   .   .   .
+#                   .
+#                   .
+#                   .
+#   .               .
+#           .
+_GLYPH_3 = (
+    "(Character: 3)",
+    _FAST,
+    (0, 1),
+    _ON,
+    _SLOW,
+    (2, 0),
+    (4, 1),
+    (4, 4),
+    (3, 5),
+    (1, 5),
+    _OFF,
+    _FAST,
+    (3, 5),
+    _ON,
+    _SLOW,
+    (4, 6),
+    (4, 8),
+    (2, 9),
+    (0, 8),
+    _OFF,
+    _FAST,
+)
+
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#   .   .   .   .   .
+#                   .
+#                   .
+#                   .
+#                   .
+#                   .
+_GLYPH_4 = (
+    "(Character: 4)",
+    _FAST,
+    (0, 9),
+    _ON,
+    _SLOW,
+    (0, 5),
+    (4, 5),
+    _OFF,
+    _FAST,
+    (4, 9),
+    _ON,
+    _SLOW,
+    (4, 0),
+    _OFF,
+    _FAST,
+)
+
+#   .   .   .   .   .
+#   .
+#   .
+#   .
+#   .   .   .
+#               .
+#                   .
+#                   .
+#                   .
+#   .   .   .   .
+_GLYPH_5 = (
+    "(Character: 5)",
+    _FAST,
+    (4, 9),
+    _ON,
+    _SLOW,
+    (0, 9),
+    (0, 5),
+    (2, 5),
+    (4, 3),
+    (4, 1),
+    (3, 0),
+    (0, 0),
+    _OFF,
+    _FAST,
+)
+
+#           .   .   .
+#
+#   .
+#   .
+#   .       .
+#   .
+#   .               .
+#   .               .
+#   .
+#       .   .   .
+_GLYPH_6 = (
+    "(Character: 6)",
+    _FAST,
+    (4, 9),
+    _ON,
+    _SLOW,
+    (2, 9),
+    (0, 7),
+    (0, 1),
+    (1, 0),
+    (3, 0),
+    (4, 2),
+    (4, 3),
+    (2, 5),
+    (0, 4),
+    _OFF,
+    _FAST,
+)
+
+#   .               .
+#
+#
+#
+#
+#
+#
+#
+#
+#   .
+_GLYPH_7 = (
+    _FAST,
+    "(Character: 7)",
+    (0, 0),
+    _ON,
+    _SLOW,
+    (4, 9),
+    (0, 9),
+    _OFF,
+    _FAST,
+)
+
+#       .       .
+#   .               .
+#   .               .
+#   .               .
+#       .       .
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#       .   .   .
+_GLYPH_8 = (
+    "(Character: 8)",
+    _FAST,
+    (2, 0),
+    _ON,
+    _SLOW,
+    (3, 0),
+    (4, 1),
+    (4, 4),
+    (3, 5),
+    (1, 5),
+    (0, 6),
+    (0, 8),
+    (1, 9),
+    (3, 9),
+    (4, 8),
+    (4, 6),
+    (3, 5),
+    (1, 5),
+    (0, 4),
+    (0, 1),
+    (1, 0),
+    (3, 0),
+    _OFF,
+    _FAST,
+)
+
+#       .       .
+#
+#   .               .
+#
+#                   .
+#       .           .
+#                   .
+#                   .
+#                   .
+#                   .
+_GLYPH_9 = (
+    "(Character: 9)",
+    _FAST,
+    (4, 0),
+    _ON,
+    _SLOW,
+    (4, 7),
+    (3, 9),
+    (1, 9),
+    (0, 7),
+    (1, 4),
+    (4, 4),
+    _OFF,
+    _FAST,
+)
+
+#       .   .   .
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#   .               .
+#       .   .   .
+_GLYPH_0 = (
+    "(Character: 0)",
+    _FAST,
+    (0, 1),
+    _ON,
+    _SLOW,
+    (0, 8),
+    (1, 9),
+    (3, 9),
+    (4, 8),
+    (4, 1),
+    (3, 0),
+    (1, 0),
+    (0, 1),
+    _OFF,
+    _FAST,
+)
+
+# d8888b. db    db d8b   db  .o88b. d888888b db    db  .d8b.  d888888b d888888b  .d88b.  d8b   db
+# 88  `8D 88    88 888o  88 d8P  Y8 `~~88~~' 88    88 d8' `8b `~~88~~'   `88'   .8P  Y8. 888o  88
+# 88oodD' 88    88 88V8o 88 8P         88    88    88 88ooo88    88       88    88    88 88V8o 88
+# 88~~~   88    88 88 V8o88 8b         88    88    88 88~~~88    88       88    88    88 88 V8o88
+# 88      88b  d88 88  V888 Y8b  d8    88    88b  d88 88   88    88      .88.   `8b  d8' 88  V888
+# 88      ~Y8888P' VP   V8P  `Y88P'    YP    ~Y8888P' YP   YP    YP    Y888888P  `Y88P'  VP   V8P
+
+# Template
+    #   0   1   2   3   4  5
+#9
+#8
+#7
+#6
+#5
+#4
+#3
+#2
+#1
+#0
+
+#   0   1   2   3   4   5   6
+#9      o
+#8  o       o               o
+#7  o       o           o
+#6      o           o
+#5              o
+#4          o
+#3      o            o
+#2  o            o        o
+#1               o        o
+#0                   o
+_GLYPH_PERCENT = (
+    "(Character: %)",
+    _FAST,
+    (0, 7),  # Position for upper circle
+    _ON,
+    _SLOW,
+    (0, 8),  # Upper circle
+    (1, 9),  # Upper circle
+    (2, 8),  # Upper circle
+    (2, 7),  # Upper circle
+    (1, 6),  # Upper circle
+    (0, 7),  # Upper circle
+    _OFF,
+    _FAST,
+    (0, 2),  # Position for up stroke
+    _ON,
+    _SLOW,
+    (5, 8),  # Up stroke
+    _OFF,
+    _FAST,
+    (0+3, 7-7),  # Position for lower circle
+    _ON,
+    _SLOW,
+    (0+3, 8-6),  # Lower circle
+    (1+3, 9-6),  # Lower circle
+    (2+3, 8-6),  # Lower circle
+    (2+3, 7-6),  # Lower circle
+    (1+3, 6-6),  # Lower circle
+    (0+3, 7-6),  # Lower circle
+    _OFF,
+    _FAST,
+)
+
+#   0   1   2   3   4  5
+#9
+#8
+#7          +
+#6          +
+#5  +   +   +   +   +
+#4          +
+#3          +
+#2
+#1
+#0
+_GLYPH_PLUS = (
+    "(Character: +)",
+    _FAST,
+    (0, 5),  # Position for horiz stroke
+    _ON,
+    _SLOW,
+    (4, 5),  # Horizontal stroke
+    _OFF,
+    _FAST,
+    (2, 3),  # Position for up stroke
+    _ON,
+    _SLOW,
+    (2, 7),  # Up stroke
+    _OFF,
+    _FAST,
+)
+
+#   0   1   2   3   4  5
+#9
+#8
+#7
+#6
+#5  +   +   +   +   +
+#4
+#3
+#2
+#1
+#0
+_GLYPH_MINUS = (
+    "(Character: -)",
+    _FAST,
+    (0, 5),  # Position for horiz stroke
+    _ON,
+    _SLOW,
+    (4, 5),  # Horizontal stroke
+    _OFF,
+    _FAST,
+)
+
+#   0   1   2   3   4  5
+#9
+#8
+#7
+#6
+#5
+#4
+#3
+#2
+#1
+#0  o  o
+_GLYPH_PERIOD = (
+    "(Character: .)",
+    _FAST,
+    (-1.5, 0),  # Position for dot
+    _ON,
+    _SLOW,
+    (-1, 0),  # Horizontal stroke
+    _OFF,
+    _FAST,
+)
+
 class Text(Shape):
     '''
     Draws characters for a text string.
@@ -1192,21 +2838,88 @@ class Text(Shape):
 
     # TODO: Text: Character size is really in doc units (mm,in). Update to match.
 
+    # Glyph and x advance for each supported character.
+    # A space advances 12: the 4 unit word gap plus the usual 8 unit advance.
+    _CHAR_TABLE = {
+        " ": (_GLYPH_SPACE, 12),
+        "A": (_GLYPH_A, 8),
+        "B": (_GLYPH_B, 8),
+        "C": (_GLYPH_C, 8),
+        "D": (_GLYPH_D, 8),
+        "E": (_GLYPH_E, 8),
+        "F": (_GLYPH_F, 8),
+        "G": (_GLYPH_G, 8),
+        "H": (_GLYPH_H, 8),
+        "I": (_GLYPH_I, 7),
+        "J": (_GLYPH_J, 7),
+        "K": (_GLYPH_K, 8),
+        "L": (_GLYPH_L, 8),
+        "M": (_GLYPH_M, 8),
+        "N": (_GLYPH_N, 8),
+        "O": (_GLYPH_O, 8),
+        "P": (_GLYPH_P, 8),
+        "Q": (_GLYPH_Q, 8),
+        "R": (_GLYPH_R, 8),
+        "S": (_GLYPH_S, 8),
+        "T": (_GLYPH_T, 7),
+        "U": (_GLYPH_U, 8),
+        "V": (_GLYPH_V, 7),
+        "W": (_GLYPH_W, 9),
+        "X": (_GLYPH_X, 7),
+        "Y": (_GLYPH_Y, 7),
+        "Z": (_GLYPH_Z, 8),
+        "1": (_GLYPH_1, 7),
+        "2": (_GLYPH_2, 7),
+        "3": (_GLYPH_3, 7),
+        "4": (_GLYPH_4, 7),
+        "5": (_GLYPH_5, 7),
+        "6": (_GLYPH_6, 7),
+        "7": (_GLYPH_7, 7),
+        "8": (_GLYPH_8, 7),
+        "9": (_GLYPH_9, 7),
+        "0": (_GLYPH_0, 7),
+        "+": (_GLYPH_PLUS, 7),
+        "-": (_GLYPH_MINUS, 7),
+        ".": (_GLYPH_PERIOD, 0),
+        "%": (_GLYPH_PERCENT, 7),
+    }
+
+    # Characters that can be rendered.
+    _SUPPORTED = frozenset(_CHAR_TABLE)
+
+    # All glyphs packed into one array, with each character's location.
+    _ATLAS_XY, _ATLAS_CMDS, _ATLAS_INDEX = _build_atlas(_CHAR_TABLE)
+
+    # Rendered strings keyed by (text, size_mm, rotation_rad).
+    # Labels repeat a lot, least recently used entries are dropped once full.
+    _RENDER_CACHE      = OrderedDict()
+    _RENDER_CACHE_SIZE = 256
+
     def __init__(self, text:str, size_mm:float=1, rotation_deg:float=0, x:float=0.0, y:float=0.0, speed_print:float=None, laser_power=None):
 
         # Shape handles a lot of pieces for us.
         super().__init__(x=x, y=y, speed_print=speed_print, laser_power=laser_power)
 
         # set basic passed args
-        self.text     = text.upper()  # Only support a single case.
+        # Only support a single case.  Skip the copy if nothing is lower case.
+        self.text     = text.upper() if any(map(str.islower, text)) else text
         self.size_mm  = size_mm
         self.rotation_rad = math.radians(rotation_deg)
 
         # set global class vars
-        self.operations_raw   = []  # Raw character points, no scaling or rotation.
-        self.operations_final = []  # Scaled and rotated character points
+        # Character operations are stored as parallel arrays of (x,y) points
+        # and command codes.  Command entries have NaN points, and comment
+        # text is stored by entry index.
+        self.xy_raw   = np.empty((0,2))               # Raw character points, no scaling or rotation.
+        self.xy       = np.empty((0,2))               # Scaled and rotated character points
+        self.cmds     = np.empty(0, dtype=np.int8)    # Command code for each entry
+        self.comments = {}
         self.offset_x = 0
 
+        # Last generated G-code body and the settings it was generated with.
+        self._gcode_key  = None
+        self._gcode_body = None
+
         # Finalized text extents
         self.x_min =  math.inf
         self.x_max = -math.inf
@@ -1216,9 +2929,29 @@ class Text(Shape):
         # Set default header
         self.header = f'Text: "{self.text}"'
 
-        # Render the string into points
-        self.CollectCharacters()
-        self.RenderPoints()
+        # Render the string into points, reusing an earlier rendering if possible.
+        key    = (self.text, self.size_mm, self.rotation_rad)
+        cache  = self._RENDER_CACHE
+        render = cache.get(key)
+        if render is None:
+            self.CollectCharacters()
+            self.RenderPoints()
+
+            # Arrays and comments are shared between Text objects from here on.
+            for array in (self.xy_raw, self.xy, self.cmds):
+                array.flags.writeable = False
+            self.comments = MappingProxyType(self.comments)
+
+            if len(cache) >= self._RENDER_CACHE_SIZE:
+                cache.popitem(last=False)
+            cache[key] = (self.xy_raw, self.xy, self.cmds, self.comments,
+                          self.offset_x, self.x_max, self.y_max)
+        else:
+            cache.move_to_end(key)
+            (self.xy_raw, self.xy, self.cmds, self.comments,
+             self.offset_x, self.x_max, self.y_max) = render
+            self.x_min = 0
+            self.y_min = 0
 
     def Size(self):
         '''
@@ -1232,1778 +2965,127 @@ class Text(Shape):
         Characters are vectors not rasters, so included positioning & printing moves.
         '''
 
-        for point in self.operations_raw:
-            if isinstance(point,tuple):
-                # Point coordinate
+        # Points among the commands.
+        mask = self.cmds == TextCommand.POINT
+        pts  = self.xy_raw[mask]
 
-                # Default character size is 9 units tall.  Scale down.
-                scale_factor = 1/9
-                point = (point[0] * scale_factor, point[1] * scale_factor)
+        # Default character size is 9 units tall and 1 mm.
+        # Scale to size and rotate in a single transform,
+        # setting bounding box lower left corner to (0,0)
+        scale = self.size_mm/9
+        c = math.cos(self.rotation_rad) * scale
+        s = math.sin(self.rotation_rad) * scale
+        pts, self.x_max, self.y_max = _transform_points(pts, c, -s, s, c)
+        self.x_min = 0
+        self.y_min = 0
 
-                # Perform scaling
-                # Default size is 1 mm
-                if self.size_mm != 1:
-                    scaledPoint = (point[0] * self.size_mm, point[1] * self.size_mm)
-                else:
-                    scaledPoint = (point[0], point[1])
-
-                # Perform rotation
-                if self.rotation_rad != 0:
-                    originX = 0
-                    originY = 0
-                    newpointX = (
-                        originX
-                        + math.cos(self.rotation_rad) * (scaledPoint[0] - originX)
-                        - math.sin(self.rotation_rad) * (scaledPoint[1] - originY)
-                    )
-                    newpointY = (
-                        originY
-                        + math.sin(self.rotation_rad) * (scaledPoint[0] - originX)
-                        + math.cos(self.rotation_rad) * (scaledPoint[1] - originY)
-                    )
-                    newpoint = (newpointX, newpointY)
-                else:
-                    newpoint = (scaledPoint[0], scaledPoint[1])
-
-                self.operations_final.append(newpoint)
-
-                # Capture extents
-                if newpoint[0] > self.x_max:
-                    self.x_max = newpoint[0]
-                if newpoint[0] < self.x_min:
-                    self.x_min = newpoint[0]
-                if newpoint[1] > self.y_max:
-                    self.y_max = newpoint[1]
-                if newpoint[1] < self.y_min:
-                    self.y_min = newpoint[1]
-
-            elif isinstance(point, str):
-                # Command
-                self.operations_final.append(point)
-
-        # Take a second pass through the points to set bounding box lower left
-        # corner to (0,0)
-        for idx,point in enumerate(self.operations_final):
-            if isinstance(point,tuple):
-                newPoint = (point[0] - self.x_min, point[1] - self.y_min)
-                self.operations_final[idx] = newPoint
-
-        # Adjust extents
-        self.x_max -= self.x_min
-        self.x_min  = 0
-        self.y_max -= self.y_min
-        self.y_min  = 0
+        # Merge transformed points back in with the commands.
+        self.xy = self.xy_raw.copy()
+        self.xy[mask] = pts
+
+        # Points changed, previous G-code is stale.
+        self._gcode_key = None
 
     def CollectCharacters(self):
-        # get and call functions for letter in given text and append them to queue
+        # Look up the glyph for each letter in given text and append it to queue
 
-        # TODO: Text: Move x_offset updates into the character methods.
-        # TODO: Text: create a character class that knows all it's stuff.
-        # TODO: Text: Create a dictionary of character objects.
         # TODO: Text: Support LF/CR to allow for multiple line text, add y_offset
 
-        for char in self.text:
-            if char == " ":
-                self.whiteSpace()
-                self.offset_x += 8
-
-            elif char == "A":
-                self.a()
-                self.offset_x += 8
-
-            elif char == "B":
-                self.b()
-                self.offset_x += 8
-
-            elif char == "C":
-                self.c()
-                self.offset_x += 8
-
-            elif char == "D":
-                self.d()
-                self.offset_x += 8
-
-            elif char == "E":
-                self.e()
-                self.offset_x += 8
-
-            elif char == "F":
-                self.f()
-                self.offset_x += 8
-
-            elif char == "G":
-                self.g()
-                self.offset_x += 8
-
-            elif char == "H":
-                self.h()
-                self.offset_x += 8
-
-            elif char == "I":
-                self.i()
-                self.offset_x += 7
-
-            elif char == "J":
-                self.j()
-                self.offset_x += 7
-
-            elif char == "K":
-                self.k()
-                self.offset_x += 8
-
-            elif char == "L":
-                self.l()
-                self.offset_x += 8
-
-            elif char == "M":
-                self.m()
-                self.offset_x += 8
-
-            elif char == "N":
-                self.n()
-                self.offset_x += 8
-
-            elif char == "O":
-                self.o()
-                self.offset_x += 8
-
-            elif char == "P":
-                self.p()
-                self.offset_x += 8
-
-            elif char == "Q":
-                self.q()
-                self.offset_x += 8
-
-            elif char == "R":
-                self.r()
-                self.offset_x += 8
-
-            elif char == "S":
-                self.s()
-                self.offset_x += 8
-
-            elif char == "T":
-                self.t()
-                self.offset_x += 7
-
-            elif char == "U":
-                self.u()
-                self.offset_x += 8
-
-            elif char == "V":
-                self.v()
-                self.offset_x += 7
-
-            elif char == "W":
-                self.w()
-                self.offset_x += 9
-
-            elif char == "X":
-                self.x()
-                self.offset_x += 7
-
-            elif char == "Y":
-                self.y()
-                self.offset_x += 7
-
-            elif char == "Z":
-                self.z()
-                self.offset_x += 8
-
-            elif char == "1":
-                self.one()
-                self.offset_x += 7
-
-            elif char == "2":
-                self.two()
-                self.offset_x += 7
-
-            elif char == "3":
-                self.three()
-                self.offset_x += 7
-
-            elif char == "4":
-                self.four()
-                self.offset_x += 7
-
-            elif char == "5":
-                self.five()
-                self.offset_x += 7
-
-            elif char == "6":
-                self.six()
-                self.offset_x += 7
-
-            elif char == "7":
-                self.seven()
-                self.offset_x += 7
-
-            elif char == "8":
-                self.eight()
-                self.offset_x += 7
-
-            elif char == "9":
-                self.nine()
-                self.offset_x += 7
-
-            elif char == "0":
-                self.zero()
-                self.offset_x += 7
-
-            elif char == "+":
-                self.plus()
-                self.offset_x += 7
-
-            elif char == "-":
-                self.minus()
-                self.offset_x += 7
-
-            elif char == ".":
-                self.period()
-                self.offset_x += 0
-
-            elif char == "%":
-                self.percentage()
-                self.offset_x += 7
-
-            else:
-                raise ValueError(f"Unsupported character: '{char}'")
+        # Check for unsupported characters before doing any work.
+        bad = set(self.text) - self._SUPPORTED
+        if bad:
+            bad = ', '.join(f"'{char}'" for char in sorted(bad))
+            raise ValueError(f"Unsupported character: {bad}")
+
+        # Atlas location of each character's glyph.
+        index    = self._ATLAS_INDEX
+        entries  = [index[char] for char in self.text]
+        starts   = np.array([entry[0] for entry in entries], dtype=np.intp)
+        lengths  = np.array([entry[1] for entry in entries], dtype=np.intp)
+        advances = np.array([entry[2] for entry in entries], dtype=np.intp)
+
+        # Start of each character in the output, and its x offset.
+        ends    = np.cumsum(lengths)
+        firsts  = ends - lengths
+        offsets = self.offset_x + np.cumsum(advances) - advances
+        total   = int(ends[-1]) if len(ends) else 0
+
+        # Gather all glyphs from the atlas at once, shifting by the character offset.
+        rows = np.arange(total) + np.repeat(starts - firsts, lengths)
+        xy   = self._ATLAS_XY[rows].astype(np.float64)
+        cmds = self._ATLAS_CMDS[rows]
+        xy[:,0] += np.repeat(offsets, lengths)
+        self.offset_x += int(advances.sum())
+
+        comments = {}
+        for first,entry in zip(firsts.tolist(), entries):
+            for idx,text in entry[3]:
+                comments[first + idx] = text
+
+        self.xy_raw   = xy
+        self.cmds     = cmds
+        self.comments = comments
                 
-    def GCode(self, doc):
+    def _gcode_emit(self, doc):
         '''
         Generates G-Code for text string object.
         '''
 
         # Shape preamble, handles shape header.
-        super().GCode(doc)
-
-        # Set shape specific power if specified
-        if self.laser_power is not None:
-            doc.laser_power = self.laser_power
-
-        # replace placeholder string commands with GCODE commands
-        laser_on = False
-        for command in self.operations_final:
-            if isinstance(command,str):
-                if command == "off":
-                    command = doc.laser_off
-                    laser_on = False
-                elif command == "on":
-                    command = doc.laser_on
-                    laser_on = True
-                elif command == "fast":
-                    command = f'F{doc.speed_position:0.1f}'
-                elif command == "slow":
-                    # Set print speed, using default if needed.
-                    if self.speed_print is None:
-                        command = f'F{doc.speed_print:0.1f}'
-                    else:
-                        command = f'F{self.speed_print:0.1f}'
-
-                # Command already rendered, just capture.
-                doc.AddLine(command)
-
-            if isinstance(command,tuple):
-                # Point that needs to be rendered, appying position offset
-                gcmd = 'G1'
-                if not laser_on:
-                    gcmd = 'G0'
-
-                doc.AddLine(f'{gcmd} X{self.x + command[0]:0.3f} Y{self.y + command[1]:0.3f} Z0')
-
-        # Laser off & return to default power.
-        doc.AddLine(doc.laser_off)  # This is likely redundant, but it's safer
+        speed, laser_on_code = self._gcode_preamble(doc)
+        speed = _FMT_F % speed
+
+        # Text position offset
+        x = self.x
+        y = self.y
+
+        # Reuse the last generated body if nothing it depends on changed.
+        laser_off = doc.laser_off
+        fast      = _FMT_F % doc.speed_position
+        key       = (laser_on_code, laser_off, fast, speed, x, y, doc.EOL)
+        if key != self._gcode_key:
+            # G-code for each command code.
+            commands = {TextCommand.OFF:  laser_off,
+                        TextCommand.ON:   laser_on_code,
+                        TextCommand.FAST: fast,
+                        TextCommand.SLOW: speed}
+
+            cmds   = self.cmds
+            points = cmds == TextCommand.POINT
+
+            # Points are printing moves if the last laser on/off command
+            # before them turned the laser on.
+            switch   = (cmds == TextCommand.ON) | (cmds == TextCommand.OFF)
+            last     = np.maximum.accumulate(np.where(switch, np.arange(len(cmds)), 0))
+            laser_on = switch[last] & (cmds[last] == TextCommand.ON)
+            gcmds    = np.where(laser_on[points], 'G1', 'G0').tolist()
+
+            # Format all points in one pass, appying position offset,
+            # then fill in the commands around them.
+            xs    = (x + self.xy[points,0]).tolist()
+            ys    = (y + self.xy[points,1]).tolist()
+            lines = np.empty(len(cmds), dtype=object)
+            lines[points] = list(map(_FMT_TEXT_XY.__mod__, zip(gcmds, xs, ys)))
+            for code,command in commands.items():
+                lines[cmds == code] = command
+            for i,comment in self.comments.items():
+                lines[i] = comment
+            lines = lines.tolist()
+
+            # Laser off
+            lines.append(laser_off)  # This is likely redundant, but it's safer
+
+            self._gcode_key  = key
+            self._gcode_body = doc.EOL.join(lines)
+
+        # Body & return to default power.
+        doc.AddLine(self._gcode_body)
         doc.laser_power = doc.laser_power_default
 
         # Footer
-        if self._footer is not None:
+        if self._footer is not None and doc._debug_comments:
             doc.AddLine(f'({self._footer})')
 
-        return doc.code
-
-    def appendPoints(self, points):
-        '''
-        Appends character data to the operations list.
-        '''
-        for point in points:
-            self.operations_raw.append(point)
-
-    #  .o88b. db   db  .d8b.  d8888b.  .d8b.   .o88b. d888888b d88888b d8888b. .d8888.
-    # d8P  Y8 88   88 d8' `8b 88  `8D d8' `8b d8P  Y8 `~~88~~' 88'     88  `8D 88'  YP
-    # 8P      88ooo88 88ooo88 88oobY' 88ooo88 8P         88    88ooooo 88oobY' `8bo.
-    # 8b      88~~~88 88~~~88 88`8b   88~~~88 8b         88    88~~~~~ 88`8b     `Y8b.
-    # Y8b  d8 88   88 88   88 88 `88. 88   88 Y8b  d8    88    88.     88 `88. db   8D
-    #  `Y88P' YP   YP YP   YP 88   YD YP   YP  `Y88P'    YP    Y88888P 88   YD `8888Y'
-
-    def whiteSpace(self):
-        # whitespace function for spaces
-        self.offset_x += 4
-
-    def a(self):
-
-        #           .   .
-        #       .           .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .   .   .   .   .   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: A)",
-            "on",
-            "slow",
-            (0 + xOff, 0),
-            (0 + xOff, 7),
-            (1 + xOff, 8),
-            (2 + xOff, 9),
-            (3 + xOff, 9),
-            (4 + xOff, 8),
-            (5 + xOff, 7),
-            (5 + xOff, 0),
-            "off",
-            "fast",
-            (5 + xOff, 4),
-            "on",
-            "slow",
-            (0 + xOff, 4),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def b(self):
-
-        #   .   .   .   .
-        #   .               .
-        #   .                   .
-        #   .                   .
-        #   .               .
-        #   .   .   .   .
-        #   .               .
-        #   .                   .
-        #   .                   .
-        #   .   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: B)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 0),
-            (0 + xOff, 9),
-            (3 + xOff, 9),
-            (4 + xOff, 8),
-            (5 + xOff, 7),
-            (5 + xOff, 6),
-            (4 + xOff, 5),
-            (3 + xOff, 4),
-            (0 + xOff, 4),
-            "off",
-            "fast",
-            (3 + xOff, 4),
-            "on",
-            "slow",
-            (4 + xOff, 3),
-            (5 + xOff, 2),
-            (5 + xOff, 1),
-            (4 + xOff, 0),
-            (0 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def c(self):
-
-        #       .   .   .   .
-        #   .                   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .                   .
-        #       .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: C)",
-            "fast",
-            (0 + xOff, 0),
-            "off",
-            "fast",
-            (5 + xOff, 1),
-            "on",
-            "slow",
-            (4 + xOff, 0),
-            (1 + xOff, 0),
-            (0 + xOff, 1),
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (4 + xOff, 9),
-            (5 + xOff, 8),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def d(self):
-
-        #   .   .   .   .
-        #   .               .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .               .
-        #   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: D)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            (3 + xOff, 9),
-            (4 + xOff, 8),
-            (5 + xOff, 7),
-            (5 + xOff, 2),
-            (4 + xOff, 1),
-            (3 + xOff, 0),
-            (0 + xOff, 0),
-            (0 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def e(self):
-
-        #   .   .   .   .   .   .
-        #   .
-        #   .
-        #   .
-        #   .   .   .   .   .   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .   .   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: E)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            (5 + xOff, 9),
-            "off",
-            "fast",
-            (5 + xOff, 5),
-            "on",
-            "slow",
-            (0 + xOff, 5),
-            "off",
-            "fast",
-            (5 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 0),
-            (0 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def f(self):
-
-        #   .   .   .   .   .   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .   .   .   .   .   .
-        #   .
-        #   .
-        #   .
-        #   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: F)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            (5 + xOff, 9),
-            "off",
-            "fast",
-            (5 + xOff, 5),
-            "on",
-            "slow",
-            (0 + xOff, 5),
-            "off",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def g(self):
-
-        #       .   .   .   .
-        #   .                   .
-        #   .
-        #   .
-        #   .
-        #   .               .   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #       .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: G)",
-            "off",
-            "fast",
-            (5 + xOff, 8),
-            "on",
-            "slow",
-            (4 + xOff, 9),
-            (1 + xOff, 9),
-            (0 + xOff, 8),
-            (0 + xOff, 1),
-            (1 + xOff, 0),
-            (4 + xOff, 0),
-            (5 + xOff, 1),
-            (5 + xOff, 4),
-            (4 + xOff, 4),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def h(self):
-
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .   .   .   .   .   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: H)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            "off",
-            "fast",
-            (5 + xOff, 9),
-            "on",
-            "slow",
-            (5 + xOff, 0),
-            "off",
-            "fast",
-            (0 + xOff, 5),
-            "on",
-            "slow",
-            (5 + xOff, 5),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def i(self):
-
-        #   .   .   .   .   .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #   .   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: I)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (4 + xOff, 0),
-            "off",
-            "fast",
-            (4 + xOff, 9),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            "off",
-            "fast",
-            (2 + xOff, 9),
-            "on",
-            "slow",
-            (2 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def j(self):
-
-        #   .   .   .   .   .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: J)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (1 + xOff, 0),
-            (2 + xOff, 1),
-            (2 + xOff, 9),
-            (0 + xOff, 9),
-            "off",
-            "fast",
-            (2 + xOff, 9),
-            "on",
-            "slow",
-            (4 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def k(self):
-
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .               .
-        #   .           .
-        #   .   .   .
-        #   .           .
-        #   .               .
-        #   .                   .
-        #   .                   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: K)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            "off",
-            "fast",
-            (5 + xOff, 9),
-            "on",
-            "slow",
-            (5 + xOff, 7),
-            (4 + xOff, 6),
-            (3 + xOff, 5),
-            (2 + xOff, 4),
-            (1 + xOff, 4),
-            (0 + xOff, 4),
-            (2 + xOff, 4),
-            (3 + xOff, 3),
-            (4 + xOff, 2),
-            (5 + xOff, 1),
-            (5 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def l(self):
-
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #   .   .   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: L)",
-            "fast",
-            (0 + xOff, 9),
-            "on",
-            "slow",
-            (0 + xOff, 0),
-            (5 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def m(self):
-
-        #   .                       .
-        #   .   .               .   .
-        #   .       .       .       .
-        #   .           .           .
-        #   .           .           .
-        #   .                       .
-        #   .                       .
-        #   .                       .
-        #   .                       .
-        #   .                       .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: M)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            (1 + xOff, 8),
-            (2 + xOff, 7),
-            (3 + xOff, 6),
-            (3 + xOff, 5),
-            (3 + xOff, 6),
-            (4 + xOff, 7),
-            (5 + xOff, 8),
-            (6 + xOff, 9),
-            (6 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def n(self):
-
-        #   .                   . APROXIMATE, letting the cnc handle this movement
-        #   . .                 .
-        #   .   .               .
-        #   .      .            .
-        #   .                   .
-        #   .        .          .
-        #   .                   .
-        #   .          .        .
-        #   .             .     .
-        #   .                .  .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: N)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            (5 + xOff, 0),
-            (5 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def o(self):
-
-        #       .   .   .   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #       .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: O)",
-            "fast",
-            (0 + xOff, 1),
-            "on",
-            "slow",
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (4 + xOff, 9),
-            (5 + xOff, 8),
-            (5 + xOff, 1),
-            (4 + xOff, 0),
-            (1 + xOff, 0),
-            (0 + xOff, 1),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def p(self):
-
-        #       .   .   .   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .   .   .   .   .
-        #   .
-        #   .
-        #   .
-        #   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: P)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (4 + xOff, 9),
-            (5 + xOff, 8),
-            (5 + xOff, 5),
-            (4 + xOff, 4),
-            (0 + xOff, 4),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def q(self):
-
-        #       .   .   .   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .               .
-        #       .   .   .       .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: Q)",
-            "fast",
-            (0 + xOff, 1),
-            "on",
-            "slow",
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (4 + xOff, 9),
-            (5 + xOff, 8),
-            (5 + xOff, 2),
-            (4 + xOff, 1),
-            (5 + xOff, 0),
-            "off",
-            "fast",
-            (4 + xOff, 1),
-            "on",
-            "slow",
-            (4 + xOff, 1),
-            (3 + xOff, 0),
-            (1 + xOff, 0),
-            (0 + xOff, 1),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def r(self):
-
-        #       .   .   .
-        #   .               .
-        #   .                   .
-        #   .                   .
-        #   .               .
-        #   .   .   .   .
-        #   .               .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: R)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (3 + xOff, 9),
-            (4 + xOff, 8),
-            (5 + xOff, 7),
-            (5 + xOff, 6),
-            (4 + xOff, 5),
-            (3 + xOff, 4),
-            (0 + xOff, 4),
-            "off",
-            "fast",
-            (3 + xOff, 4),
-            "on",
-            "slow",
-            (4 + xOff, 3),
-            (5 + xOff, 2),
-            (5 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def s(self):
-
-        #       .   .   .   .   .
-        #   .
-        #   .
-        #   .
-        #   .
-        #       .   .   .   .
-        #                       .
-        #                       .
-        #                       .
-        #   .   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: S)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (4 + xOff, 0),
-            (5 + xOff, 1),
-            (5 + xOff, 3),
-            (4 + xOff, 4),
-            (1 + xOff, 4),
-            (0 + xOff, 5),
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (5 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def t(self):
-
-        #   .   .   .   .   .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: T)",
-            "fast",
-            (2 + xOff, 0),
-            "on",
-            "slow",
-            (2 + xOff, 9),
-            "off",
-            "fast",
-            (0 + xOff, 9),
-            "on",
-            "slow",
-            (4 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def u(self):
-
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #   .                   .
-        #       .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: U)",
-            "fast",
-            (0 + xOff, 9),
-            "on",
-            "slow",
-            (0 + xOff, 1),
-            (1 + xOff, 0),
-            (4 + xOff, 0),
-            (5 + xOff, 1),
-            (5 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def v(self):
-
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               . this one is also
-        #   .               . interpolated as top left
-        #   .               . bottom middle top right
-        #   .               .
-        #       .       .
-        #           .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: V)",
-            "fast",
-            (0 + xOff, 9),
-            "on",
-            "slow",
-            (2 + xOff, 0),
-            (4 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def w(self):
-
-        #   0   1   2   3   4  5
-        #9  o       o       o
-        #8
-        #7
-        #6
-        #5
-        #4
-        #3
-        #2
-        #1
-        #0       o       o 
-
-
-        points = [
-            "(Character: W)",
-            "fast",
-            (self.offset_x + 0, 9),
-            "on",
-            "slow",
-            (self.offset_x + 2, 0),
-            (self.offset_x + 3, 9),
-            (self.offset_x + 4, 0),
-            (self.offset_x + 6, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def x(self):
-
-        # once again, gonna be interpolation
-        #   .               .
-        #
-        #
-        #
-        #
-        #           .
-        #
-        #
-        #
-        #   .               .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: X)",
-            "fast",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (4 + xOff, 9),
-            "off",
-            "fast",
-            (0 + xOff, 9),
-            "on",
-            "slow",
-            (4 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def y(self):
-
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #       .       .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: Y)",
-            "fast",
-            (2 + xOff, 0),
-            "on",
-            "slow",
-            (2 + xOff, 4),
-            (0 + xOff, 6),
-            (0 + xOff, 9),
-            "off",
-            "fast",
-            (4 + xOff, 9),
-            "on",
-            "slow",
-            (4 + xOff, 6),
-            (2 + xOff, 4),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def z(self):
-
-        # more point to point interpolation? yeah lmao
-        #   .                   .
-        #
-        #
-        #
-        #
-        #
-        #
-        #
-        #
-        #   .                   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: Z)",
-            "fast",
-            (0 + xOff, 9),
-            "on",
-            "slow",
-            (5 + xOff, 9),
-            (0 + xOff, 0),
-            (5 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    # d8b   db db    db .88b  d88. d8888b. d88888b d8888b. .d8888.
-    # 888o  88 88    88 88'YbdP`88 88  `8D 88'     88  `8D 88'  YP
-    # 88V8o 88 88    88 88  88  88 88oooY' 88ooooo 88oobY' `8bo.
-    # 88 V8o88 88    88 88  88  88 88~~~b. 88~~~~~ 88`8b     `Y8b.
-    # 88  V888 88b  d88 88  88  88 88   8D 88.     88 `88. db   8D
-    # VP   V8P ~Y8888P' YP  YP  YP Y8888P' Y88888P 88   YD `8888Y'
-
-    def one(self):
-
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-        #           .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 1)",
-            "fast",
-            (2 + xOff, 0),
-            "on",
-            "slow",
-            (2 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def two(self):
-
-        #           .
-        #   .               .
-        #
-        #
-        #
-        #
-        #
-        #
-        #
-        #   .   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 2)",
-            "fast",
-            (4 + xOff, 0),
-            "on",
-            "slow",
-            (0 + xOff, 0),
-            (4 + xOff, 8),
-            (2 + xOff, 9),
-            (0 + xOff, 8),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def three(self):
-
-        #           .
-        #   .               .
-        #                   .
-        #                   .
-        #   .   .   .   .
-        #                   .
-        #                   .
-        #                   .
-        #   .               .
-        #           .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 3)",
-            "fast",
-            (0 + xOff, 1),
-            "on",
-            "slow",
-            (2 + xOff, 0),
-            (4 + xOff, 1),
-            (4 + xOff, 4),
-            (3 + xOff, 5),
-            (1 + xOff, 5),
-            "off",
-            "fast",
-            (3 + xOff, 5),
-            "on",
-            "slow",
-            (4 + xOff, 6),
-            (4 + xOff, 8),
-            (2 + xOff, 9),
-            (0 + xOff, 8),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def four(self):
-
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .   .   .   .   .
-        #                   .
-        #                   .
-        #                   .
-        #                   .
-        #                   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 4)",
-            "fast",
-            (0 + xOff, 9),
-            "on",
-            "slow",
-            (0 + xOff, 5),
-            (4 + xOff, 5),
-            "off",
-            "fast",
-            (4 + xOff, 9),
-            "on",
-            "slow",
-            (4 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def five(self):
-
-        #   .   .   .   .   .
-        #   .
-        #   .
-        #   .
-        #   .   .   .
-        #               .
-        #                   .
-        #                   .
-        #                   .
-        #   .   .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 5)",
-            "fast",
-            (4 + xOff, 9),
-            "on",
-            "slow",
-            (0 + xOff, 9),
-            (0 + xOff, 5),
-            (2 + xOff, 5),
-            (4 + xOff, 3),
-            (4 + xOff, 1),
-            (3 + xOff, 0),
-            (0 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def six(self):
-
-        #           .   .   .
-        #
-        #   .
-        #   .
-        #   .       .
-        #   .
-        #   .               .
-        #   .               .
-        #   .
-        #       .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 6)",
-            "fast",
-            (4 + xOff, 9),
-            "on",
-            "slow",
-            (2 + xOff, 9),
-            (0 + xOff, 7),
-            (0 + xOff, 1),
-            (1 + xOff, 0),
-            (3 + xOff, 0),
-            (4 + xOff, 2),
-            (4 + xOff, 3),
-            (2 + xOff, 5),
-            (0 + xOff, 4),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def seven(self):
-
-        #   .               .
-        #
-        #
-        #
-        #
-        #
-        #
-        #
-        #
-        #   .
-
-        xOff = self.offset_x
-
-        points = [
-            "fast",
-            "(Character: 7)",
-            (0 + xOff, 0),
-            "on",
-            "slow",
-            (4 + xOff, 9),
-            (0 + xOff, 9),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def eight(self):
-
-        #       .       .
-        #   .               .
-        #   .               .
-        #   .               .
-        #       .       .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #       .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 8)",
-            "fast",
-            (2 + xOff, 0),
-            "on",
-            "slow",
-            (3 + xOff, 0),
-            (4 + xOff, 1),
-            (4 + xOff, 4),
-            (3 + xOff, 5),
-            (1 + xOff, 5),
-            (0 + xOff, 6),
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (3 + xOff, 9),
-            (4 + xOff, 8),
-            (4 + xOff, 6),
-            (3 + xOff, 5),
-            (1 + xOff, 5),
-            (0 + xOff, 4),
-            (0 + xOff, 1),
-            (1 + xOff, 0),
-            (3 + xOff, 0),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def nine(self):
-
-        #       .       .
-        #
-        #   .               .
-        #
-        #                   .
-        #       .           .
-        #                   .
-        #                   .
-        #                   .
-        #                   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 9)",
-            "fast",
-            (4 + xOff, 0),
-            "on",
-            "slow",
-            (4 + xOff, 7),
-            (3 + xOff, 9),
-            (1 + xOff, 9),
-            (0 + xOff, 7),
-            (1 + xOff, 4),
-            (4 + xOff, 4),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    def zero(self):
-
-        #       .   .   .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #   .               .
-        #       .   .   .
-
-        xOff = self.offset_x
-
-        points = [
-            "(Character: 0)",
-            "fast",
-            (0 + xOff, 1),
-            "on",
-            "slow",
-            (0 + xOff, 8),
-            (1 + xOff, 9),
-            (3 + xOff, 9),
-            (4 + xOff, 8),
-            (4 + xOff, 1),
-            (3 + xOff, 0),
-            (1 + xOff, 0),
-            (0 + xOff, 1),
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-
-    # d8888b. db    db d8b   db  .o88b. d888888b db    db  .d8b.  d888888b d888888b  .d88b.  d8b   db 
-    # 88  `8D 88    88 888o  88 d8P  Y8 `~~88~~' 88    88 d8' `8b `~~88~~'   `88'   .8P  Y8. 888o  88 
-    # 88oodD' 88    88 88V8o 88 8P         88    88    88 88ooo88    88       88    88    88 88V8o 88 
-    # 88~~~   88    88 88 V8o88 8b         88    88    88 88~~~88    88       88    88    88 88 V8o88 
-    # 88      88b  d88 88  V888 Y8b  d8    88    88b  d88 88   88    88      .88.   `8b  d8' 88  V888 
-    # 88      ~Y8888P' VP   V8P  `Y88P'    YP    ~Y8888P' YP   YP    YP    Y888888P  `Y88P'  VP   V8P 
-
-    # Template
-        #   0   1   2   3   4  5
-        #9
-        #8
-        #7
-        #6
-        #5
-        #4
-        #3
-        #2
-        #1
-        #0
-
-    def percentage(self):
-
-        #   0   1   2   3   4   5   6
-        #9      o                 
-        #8  o       o               o
-        #7  o       o           o
-        #6      o           o  
-        #5              o 
-        #4          o
-        #3      o            o
-        #2  o            o        o    
-        #1               o        o
-        #0                   o
-
-        points = [
-            "(Character: %)",
-            "fast",
-            (self.offset_x + 0, 7),  # Position for upper circle
-            "on",
-            "slow",
-            (self.offset_x + 0, 8),  # Upper circle
-            (self.offset_x + 1, 9),  # Upper circle
-            (self.offset_x + 2, 8),  # Upper circle
-            (self.offset_x + 2, 7),  # Upper circle
-            (self.offset_x + 1, 6),  # Upper circle
-            (self.offset_x + 0, 7),  # Upper circle
-            "off",
-            "fast",
-            (self.offset_x + 0, 2),  # Position for up stroke
-            "on",
-            "slow",
-            (self.offset_x + 5, 8),  # Up stroke
-            "off",
-            "fast",
-            (self.offset_x + 0+3, 7-7),  # Position for lower circle
-            "on",
-            "slow",
-            (self.offset_x + 0+3, 8-6),  # Lower circle
-            (self.offset_x + 1+3, 9-6),  # Lower circle
-            (self.offset_x + 2+3, 8-6),  # Lower circle
-            (self.offset_x + 2+3, 7-6),  # Lower circle
-            (self.offset_x + 1+3, 6-6),  # Lower circle
-            (self.offset_x + 0+3, 7-6),  # Lower circle
-            "off",
-            "fast"
-        ]
-
-        self.appendPoints(points)
-
-    def plus(self):
-
-        #   0   1   2   3   4  5
-        #9
-        #8
-        #7          +
-        #6          +
-        #5  +   +   +   +   +  
-        #4          +
-        #3          +
-        #2          
-        #1
-        #0          
-
-        points = [
-            "(Character: +)",
-            "fast",
-            (self.offset_x + 0, 5),  # Position for horiz stroke
-            "on",
-            "slow",
-            (self.offset_x + 4, 5),  # Horizontal stroke
-            "off",
-            "fast",
-            (self.offset_x + 2, 3),  # Position for up stroke
-            "on",
-            "slow",
-            (self.offset_x + 2, 7),  # Up stroke
-            "off",
-            "fast"
-        ]
-
-        self.appendPoints(points)
-                                                                                                
-    def minus(self):
-
-        #   0   1   2   3   4  5
-        #9
-        #8
-        #7          
-        #6          
-        #5  +   +   +   +   +  
-        #4          
-        #3          
-        #2          
-        #1
-        #0          
-
-        points = [
-            "(Character: -)",
-            "fast",
-            (self.offset_x + 0, 5),  # Position for horiz stroke
-            "on",
-            "slow",
-            (self.offset_x + 4, 5),  # Horizontal stroke
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
-                                                                                                
-    def period(self):
-
-        #   0   1   2   3   4  5
-        #9
-        #8
-        #7          
-        #6          
-        #5  
-        #4          
-        #3          
-        #2          
-        #1
-        #0  o  o
-
-        points = [
-            "(Character: .)",
-            "fast",
-            (self.offset_x - 1.5, 0),  # Position for dot
-            "on",
-            "slow",
-            (self.offset_x - 1, 0),  # Horizontal stroke
-            "off",
-            "fast",
-        ]
-
-        self.appendPoints(points)
 
 class DocSpeedPower(Doc):
     '''
@@ -3014,9 +3096,10 @@ class DocSpeedPower(Doc):
     for engraving or cutting.
     '''
 
-    _powers = None  
-    _speeds = None
-    _grid   = None
+    _powers      = None
+    _speeds      = None
+    _speeds_desc = None
+    _grid        = None
 
     # Default sizes
     _square_size = None
@@ -3025,8 +3108,9 @@ class DocSpeedPower(Doc):
     def __init__(self,powers:np.array=np.linspace(10,100,10),speeds:np.array=np.linspace(500,1500,11)):
         super().__init__()
 
-        self._speeds = np.sort(speeds)
-        self._powers = np.sort(powers)
+        self._speeds      = np.sort(speeds)
+        self._speeds_desc = self._speeds[::-1].copy()  # Fastest first, for rows
+        self._powers      = np.sort(powers)
 
         # Generate the document layout so it can be manipulated.
         # Grid size.  Speeds on rows, power on cols
@@ -3066,20 +3150,24 @@ class DocSpeedPower(Doc):
 
         # Generate row headers
         # Fastest speed first.
-        for row_idx, speed in enumerate(np.flip(self._speeds)):
+        for row_idx, speed in enumerate(self._speeds_desc):
             txt = Text(f'{round(speed)}',size_mm=self._text_size)  # TODO: Assumes mm/min speeds
             txt.header = f'Speed Label: {round(speed)}'
             self._grid.AddChildCell(txt,row=row_idx+1,column=0)
 
         # Generate print squares
-        for i, speed in enumerate(np.flip(self._speeds)):
-            for j,power in enumerate(self._powers):
-                sq = Rectangle(width=self._square_size,
-                                height=self._square_size, 
-                                speed_print=speed, 
-                                laser_power=power)
-                sq.header = f'Power={round(power)}%, Speed={round(speed)}'
-                self._grid.AddChildCell(sq, row=i+1,column=j+1)
+        # Speed & power for every square, fastest speed first.
+        powers, speeds = np.meshgrid(self._powers, self._speeds_desc)
+        headers = np.char.add(np.char.mod('Power=%d%%, Speed=', np.round(powers)),
+                              np.char.mod('%d', np.round(speeds))).tolist()
+        for (i,j), speed in np.ndenumerate(speeds):
+            power = powers[i,j]
+            sq = Rectangle(width=self._square_size,
+                            height=self._square_size, 
+                            speed_print=speed, 
+                            laser_power=power)
+            sq.header = headers[i][j]
+            self._grid.AddChildCell(sq, row=i+1,column=j+1)
 
         # Generate axis labels
         grid_labels = GridLayout()  # Default is 2x2
@@ -3094,17 +3182,18 @@ class DocSpeedPower(Doc):
 
         # Update header 
         # Once all elements have been added, doc size can be calculated.
-        header = self.header  # In case user set a header
-        header += 'Speed & Power Tuning Print' + self.EOL
+        # Appended in case user set a header.
         sz = self.Size()
-        header += f'Document size: {sz[0]:.1f},{sz[1]:.1f} ' + self.EOL
-        header += self.EOL
-        header += f'Speeds: {self._speeds}' + self.EOL
-        header += f'Powers: {self._powers}' + self.EOL
-        header += self.EOL
-        header += f'Square Count: {len(self._speeds)*len(self._powers)}' + self.EOL
-        header += f'Square Size : {self._square_size}' + self.EOL
-        self.header = header
+        lines = ['Speed & Power Tuning Print',
+                 f'Document size: {sz[0]:.1f},{sz[1]:.1f} ',
+                 '',
+                 f'Speeds: {self._speeds}',
+                 f'Powers: {self._powers}',
+                 '',
+                 f'Square Count: {len(self._speeds)*len(self._powers)}',
+                 f'Square Size : {self._square_size}',
+                 '']
+        self.header += self.EOL.join(lines)
 
         # Now generate the code.
         super().GCode(filename)
@@ -3180,17 +3269,19 @@ class DocFocus(Doc):
         # TODO: Make configurable with reasonable default
         txt_sz = 4
 
+        # Height labels.
+        # Negative sign gets added automatically, spaces align 0.0 with signed values.
+        heights = self._heights
+        signs   = np.where(heights > 0, '+', '')
+        signs   = np.where(np.isclose(heights,0), '    ', signs)
+        labels  = np.char.add(signs, np.char.mod('%.1f', heights)).tolist()
+
         # Fill in rows of doc
-        for row, z_height in enumerate(self._heights):
-            sign = ''  # Gets added automatically for negative
-            if z_height > 0:
-                sign = '+'
-            if np.isclose(z_height,0):
-                sign = '    ' # Aligns 0.0 with signed values
+        for row, (z_height, label) in enumerate(zip(heights, labels)):
 
             # Add label
-            txt = Text(f'{sign}{z_height:.1f}', size_mm=txt_sz)
-            txt.header = f'Z offset: {sign}{z_height:0.1f}'
+            txt = Text(label, size_mm=txt_sz)
+            txt.header = f'Z offset: {label}'
             grid.AddChildCell(txt, column=0, row=row)
 
             # Add line
@@ -3202,13 +3293,14 @@ class DocFocus(Doc):
         self.layout.AddChild(grid)
 
         # Update header
-        header = self.header  # In case user set a header
-        header += 'Laser Focus Tuning Print' + self.EOL
+        # Appended in case user set a header.
         sz = self.Size()
-        header += f'Document size: {sz[0]:.1f},{sz[1]:.1f} ' + self.EOL
-        header += self.EOL
-        header += f'Heights: {self._heights}' + self.EOL
-        self.header = header
+        lines = ['Laser Focus Tuning Print',
+                 f'Document size: {sz[0]:.1f},{sz[1]:.1f} ',
+                 '',
+                 f'Heights: {self._heights}',
+                 '']
+        self.header += self.EOL.join(lines)
 
         # Now generate the code.
         super().GCode(filename)
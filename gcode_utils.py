@@ -16,17 +16,28 @@
 # TODO: Convert spindle commands to laser commands.  One way?
 # TODO: Concatenate G-Code files.  Might want to deal with headers.
 
-import copy
 import re
 import os
 import numpy as np
 from invoke import task
 
+# Regular expressions for numeric G-code words, compiled once at import.
+_RE_NUM = r"([+-]?[0-9.]+)"
+_RE_X = re.compile("X" + _RE_NUM)
+_RE_Y = re.compile("Y" + _RE_NUM)
+_RE_Z = re.compile("Z" + _RE_NUM)
+_RE_F = re.compile("F" + _RE_NUM)
+_RE_M4S = re.compile(r"M4\sS" + _RE_NUM)
+_RE_AXIS = re.compile("([XYZ])" + _RE_NUM)
+_RE_XI = re.compile("([XI])" + _RE_NUM)
+_RE_YJ = re.compile("([YJ])" + _RE_NUM)
+_RE_XYZ = re.compile("X" + _RE_NUM + r"\s*Y" + _RE_NUM + r"\s*Z" + _RE_NUM)
+
 
 class ZBlock:
     def __init__(
         self,
-        lines: list = [],
+        lines: list = None,
         x: float = None,
         y: float = None,
         z: float = None,
@@ -37,18 +48,18 @@ class ZBlock:
         self._y_start = y
         self._z_start = z
 
-        self._re_num = "([+-]?[0-9.]+)"
-
+        if lines is None:
+            lines = []
         if not isinstance(lines, list):
             raise ValueError("lines must be a list.")
-        lines = [line.strip() for line in lines if line.strip() != ""]
+        lines = [line for line in (line.strip() for line in lines) if line]
         self._lines = lines
         self._lines[-1] += "\n"
 
         # Current z
-        res = re.search(f"Z{self._re_num}", self._lines[0])
+        res = _RE_Z.search(self._lines[0])
         if res:
-            self._z = float(res[0].replace("Z", ""))
+            self._z = float(res.group(1))
 
     def __repr__(self) -> str:
         return f"ZBlock(z={self.z}, lines={len(self._lines)}, start=[{self.xstart},{self.ystart},{self.zstart}])"
@@ -69,7 +80,7 @@ class ZBlock:
             value = float(value)
 
         # Modify first line of G-code
-        self._lines[0] = re.sub(f"Z{self._re_num}", f"Z{value}", self._lines[0])
+        self._lines[0] = _RE_Z.sub(f"Z{value}", self._lines[0])
         self._z = value
 
     @property
@@ -156,6 +167,23 @@ class ZBlock:
 
         return gcode
 
+    def clone(self):
+        """
+        Copy of this block.  The line list is copied, so lines can be
+        modified or added to the copy without affecting this block.
+
+        Returns:
+            ZBlock: Copy of this block.
+        """
+        block = ZBlock.__new__(ZBlock)
+        block._z = self._z
+        block._x_start = self._x_start
+        block._y_start = self._y_start
+        block._z_start = self._z_start
+        block._lines = list(self._lines)
+
+        return block
+
     def prepend(self, gcode: str = ""):
         """
         Prepend specified G-code to this block.
@@ -200,8 +228,7 @@ class GcodeUtils:
     # File related data
     _filename = None
     _gcode = None  # G-Code string
-
-    _re_num = "([+-]?[0-9.]+)"
+    _extents = None  # Cached Extents result, cleared when G-Code changes
 
     def __init__(self, file: str = None, gcode: str = None):
         if file is not None:
@@ -213,15 +240,44 @@ class GcodeUtils:
     def __str__(self) -> str:
         return self._gcode
 
-    def _to_str(self, value) -> str:
+    @staticmethod
+    def _to_strs(values: np.ndarray) -> list:
+        """
+        Converts an array of numeric values to a list of strings,
+        making integer if possible.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        strs = list(map("%.3f".__mod__, values.tolist()))
+        is_int = np.isfinite(values) & (values == np.trunc(values))
+        for i in np.flatnonzero(is_int).tolist():
+            strs[i] = str(int(values[i]))
+        return strs
+
+    @staticmethod
+    def _parse(values: list) -> np.ndarray:
+        """
+        Converts a list of numeric strings to a float array.
+        """
+        return np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+
+    def _rewrite(self, pattern: re.Pattern, transform):
         """
-        Converts a numeric scalar to a string value, making integer if possible.
+        Rewrites all numeric values matched by pattern in a single pass.
+
+        pattern must capture the whole word: the command letter(s) in its
+        first group and the value in its second.  transform(axes, values)
+        receives both as arrays and returns the new values.  Text between
+        matches is spliced back unchanged and the G-code is rebuilt with
+        a single join.
         """
-        if np.mod(value, 1) == 0:
-            # Integer
-            return str(int(value))
-        else:
-            return format(value, "0.3f")
+        if pattern.groups != 2:
+            raise ValueError("pattern must have exactly 2 capture groups.")
+
+        parts = pattern.split(self._gcode)
+        axes = np.array(parts[1::3])
+        values = transform(axes, self._parse(parts[2::3]))
+        parts[2::3] = self._to_strs(values)
+        self.gcode = "".join(parts)
 
     @property
     def filename(self) -> str:
@@ -240,6 +296,7 @@ class GcodeUtils:
     @gcode.setter
     def gcode(self, value: str):
         self._gcode = value
+        self._extents = None
 
     def Load(self, filename: str):
         """
@@ -251,7 +308,7 @@ class GcodeUtils:
             Name of file to load with path.
         """
         with open(filename, "r") as fp:
-            self._gcode = fp.read()
+            self.gcode = fp.read()
 
         # Store file name if everything worked out.
         self._filename = filename
@@ -297,25 +354,20 @@ class GcodeUtils:
             y = xyz[1]
             z = xyz[2]
 
-        # Replacement functions
-        def offset_x(match):
-            value = float(match.group(1)) + x
-            value = self._to_str(value)
-            return f"X{value}"
-
-        def offset_y(match):
-            value = float(match.group(1)) + y
-            value = self._to_str(value)
-            return f"Y{value}"
+        # Offset all values at once, by axis.
+        def offset(axes, values):
+            values[axes == "X"] += x
+            values[axes == "Y"] += y
+            values[axes == "Z"] += z
+            return values
 
-        def offset_z(match):
-            value = float(match.group(1)) + z
-            value = self._to_str(value)
-            return f"Z{value}"
+        self._rewrite(_RE_AXIS, offset)
 
-        self._gcode = re.sub(f"X{self._re_num}", offset_x, self._gcode)
-        self._gcode = re.sub(f"Y{self._re_num}", offset_y, self._gcode)
-        self._gcode = re.sub(f"Z{self._re_num}", offset_z, self._gcode)
+    def _mirror(self, pattern: re.Pattern):
+        """
+        Negates all values matched by pattern in a single pass.
+        """
+        self._rewrite(pattern, lambda axes, values: values * -1)
 
     def MirrorY(self):
         """
@@ -324,21 +376,8 @@ class GcodeUtils:
         See also: GcodeUtils.MirrorX
         """
 
-        # Have to handle circle/arc mode also
-
-        # Replacement functions
-        def mirror_y(match):
-            value = float(match.group(1)) * -1
-            value = self._to_str(value)
-            return f"X{value}"
-
-        def mirror_i(match):
-            value = float(match.group(1)) * -1
-            value = self._to_str(value)
-            return f"I{value}"
-
-        self._gcode = re.sub(f"X{self._re_num}", mirror_y, self._gcode)
-        self._gcode = re.sub(f"I{self._re_num}", mirror_i, self._gcode)
+        # Have to handle circle/arc mode also, so X and I are negated.
+        self._mirror(_RE_XI)
 
     def MirrorX(self):
         """
@@ -347,21 +386,8 @@ class GcodeUtils:
         See also: GcodeUtils.MirrorY
         """
 
-        # Have to handle circle/arc mode also
-
-        # Replacement functions
-        def mirror_x(match):
-            value = float(match.group(1)) * -1
-            value = self._to_str(value)
-            return f"Y{value}"
-
-        def mirror_j(match):
-            value = float(match.group(1)) * -1
-            value = self._to_str(value)
-            return f"J{value}"
-
-        self._gcode = re.sub(f"Y{self._re_num}", mirror_x, self._gcode)
-        self._gcode = re.sub(f"J{self._re_num}", mirror_j, self._gcode)
+        # Have to handle circle/arc mode also, so Y and J are negated.
+        self._mirror(_RE_YJ)
 
     def Extents(self) -> np.array:
         """
@@ -377,37 +403,23 @@ class GcodeUtils:
         """
         # TODO: Figure out how to remove origin inclusion constraint.  Filter out G0/G1 X0,Y0?
 
-        # Iterate through all matches for each dimension.
-        x_min = y_min = z_min = np.inf
-        x_max = y_max = z_max = -np.inf
-        for match in re.finditer("X" + self._re_num, self._gcode):
-            val = float(match.group(1))
-            if val < x_min:
-                x_min = val
-            elif val > x_max:
-                x_max = val
-
-        for match in re.finditer("Y" + self._re_num, self._gcode):
-            val = float(match.group(1))
-            if val < y_min:
-                y_min = val
-            elif val > y_max:
-                y_max = val
-
-        for match in re.finditer("Z" + self._re_num, self._gcode):
-            val = float(match.group(1))
-            if val < z_min:
-                z_min = val
-            elif val > z_max:
-                z_max = val
-
-        # Package
-        ext = np.array([x_min, y_min, z_min, x_max, y_max, z_max])
-
-        # Clean up inf's
-        ext[np.isinf(ext)] = 0
-
-        return ext
+        if self._extents is not None:
+            return self._extents.copy()
+
+        # Collect all axis values in a single pass, then reduce in NumPy.
+        values = {"X": [], "Y": [], "Z": []}
+        for axis, value in _RE_AXIS.findall(self._gcode):
+            values[axis].append(value)
+
+        ext = np.zeros(6)
+        for i, axis in enumerate("XYZ"):
+            if values[axis]:
+                arr = np.array(values[axis], dtype=np.float64)
+                ext[i] = arr.min()
+                ext[i + 3] = arr.max()
+
+        self._extents = ext
+        return ext.copy()
 
     def Center(self) -> np.array:
         """
@@ -494,23 +506,8 @@ class GcodeUtils:
         # - tranlate back to our original center
         center_pre = self.Center()
 
-        # Helper functions
-        def scale_x(match):
-            value = self._to_str(float(match.group(1)) * scale_factor)
-            return f"X{value}"
-
-        def scale_y(match):
-            value = self._to_str(float(match.group(1)) * scale_factor)
-            return f"Y{value}"
-
-        def scale_z(match):
-            value = self._to_str(float(match.group(1)) * scale_factor)
-            return f"Z{value}"
-
         # Perform scaling
-        self._gcode = re.sub(f"X{self._re_num}", scale_x, self._gcode)
-        self._gcode = re.sub(f"Y{self._re_num}", scale_y, self._gcode)
-        self._gcode = re.sub(f"Z{self._re_num}", scale_z, self._gcode)
+        self._rewrite(_RE_AXIS, lambda axes, values: values * scale_factor)
 
         # Translate back
         center_post = self.Center()
@@ -527,7 +524,7 @@ class GcodeUtils:
              Numpy Array with one entry per speed value used in G-Code.
         """
 
-        speeds = re.findall(f"F{self._re_num}", self._gcode)
+        speeds = _RE_F.findall(self._gcode)
         speeds = list(set(speeds))  # Get unique values.
         speeds = list(map(lambda x: float(x), speeds))  # string -> float
         speeds.sort()
@@ -545,7 +542,7 @@ class GcodeUtils:
             Numpy Array with one entry per power value used in G-Code.
         """
 
-        powers = re.findall(f"M4\sS{self._re_num}", self.gcode)
+        powers = _RE_M4S.findall(self.gcode)
         powers = list(set(powers))  # Get unique values.
         powers = list(map(lambda x: float(x), powers))  # string -> float
         powers.sort()
@@ -565,7 +562,7 @@ class GcodeUtils:
 
         # Find all Z coordinates with line number
 
-        zlevels = re.findall(f"Z{self._re_num}", self.gcode)
+        zlevels = _RE_Z.findall(self.gcode)
         zlevels = list(map(lambda x: float(x), zlevels))
 
         return zlevels
@@ -593,11 +590,15 @@ class GcodeUtils:
         x = x_prev = None
         y = y_prev = None
         z = z_prev = None
-        regex = re.compile(f"Z{self._re_num}")
+        search_x = _RE_X.search
+        search_y = _RE_Y.search
+        search_z = _RE_Z.search
         for line in lines:
+            zm = search_z(line)
+
             # If we have a Z command, start a new block.
             # TODO: need to cache from block for this block.
-            if re.search(regex, line):
+            if zm:
                 blocks.append(ZBlock(lines=block, x=x_prev, y=y_prev, z=z_prev))
                 x_prev = x
                 y_prev = y
@@ -605,15 +606,14 @@ class GcodeUtils:
                 block = []
 
             # Track starting position for next block.
-            if re.search(f"X{self._re_num}", line):
-                res = re.search(f"X{self._re_num}", line)
-                x = float(res[0].replace("X", ""))
-            if re.search(f"Y{self._re_num}", line):
-                res = re.search(f"Y{self._re_num}", line)
-                y = float(res[0].replace("Y", ""))
-            if re.search(f"Z{self._re_num}", line):
-                res = re.search(f"Z{self._re_num}", line)
-                z = float(res[0].replace("Z", ""))
+            xm = search_x(line)
+            if xm:
+                x = float(xm.group(1))
+            ym = search_y(line)
+            if ym:
+                y = float(ym.group(1))
+            if zm:
+                z = float(zm.group(1))
 
             # Append line to current block
             block.append(line)
@@ -659,14 +659,14 @@ class GcodeUtils:
 
         # Process the z-blocks in the file.
         blocks = self.zblocks()
-        code = ""
+        code = []
         op_num = 1
         for block in blocks:
             if block.z == z_min:
                 # Convert to multiple passes
                 op_num += 1
                 for i, z in enumerate(z_heights):
-                    b = copy.deepcopy(block)
+                    b = block.clone()
                     b.z = z
 
                     header = "\n"
@@ -683,13 +683,14 @@ class GcodeUtils:
                         lift = f"G0 Z{b.zstart:0.3f}"
                         b.append(lift)
 
-                    code += b.gcode + "\n"
+                    code.append(b.gcode)
+                    code.append("\n")
 
             else:
                 # Leave alone
-                code += block.gcode
+                code.append(block.gcode)
 
-        self._gcode = code
+        self.gcode = "".join(code)
 
     def ReplaceValue(self, command: str, oldvalue: float, newvalue: float):
         """
@@ -715,18 +716,12 @@ class GcodeUtils:
         See also: Speeds, Powers
         """
 
-        # Helper functions
-        def check_replace(match):
-            value = float(match.group(1))
-            if np.isclose(value, oldvalue):
-                return f"{command}{self._to_str(newvalue)}"
-            else:
-                return f"{command}{self._to_str(value)}"
+        # Helper function
+        def check_replace(axes, values):
+            return np.where(np.isclose(values, oldvalue), newvalue, values)
 
-        # Perform scaling
-        self._gcode = re.sub(
-            f"{command}{self._re_num}", check_replace, self.gcode
-        )
+        # Perform replacement
+        self._rewrite(re.compile(f"({command})" + _RE_NUM), check_replace)
 
     def Rotate(self, rotation: np.ndarray = np.eye(3)):
         """
@@ -746,25 +741,16 @@ class GcodeUtils:
         center = self.Center()
         self.TranslateCenter()
 
-        # Rotation
-        def rot(match):
-            x = float(match.group(1))
-            y = float(match.group(2))
-            z = float(match.group(3))
-
-            v = np.array([x, y, z])
-            # print(f'Before: {v}')
-            v = np.matmul(rotation, v)
-            # print(f'After : {v}')
-
-            xs = self._to_str(v[0])
-            ys = self._to_str(v[1])
-            zs = self._to_str(v[2])
-
-            return f"X{xs} Y{ys} Z{zs}"
+        # Rotation of all XYZ points at once.
+        # Split gives [text, x, y, z, text, ...].
+        parts = _RE_XYZ.split(self._gcode)
+        pts = self._parse(parts[1::4] + parts[2::4] + parts[3::4]).reshape(3, -1)
+        pts = np.matmul(rotation, pts)
 
-        expr = f"X{self._re_num}\s*Y{self._re_num}\s*Z{self._re_num}"
-        self._gcode = re.sub(expr, rot, self._gcode)
+        parts[1::4] = ["X" + v for v in self._to_strs(pts[0])]
+        parts[2::4] = [" Y" + v for v in self._to_strs(pts[1])]
+        parts[3::4] = [" Z" + v for v in self._to_strs(pts[2])]
+        self.gcode = "".join(parts)
 
         # Return to starting position
         self.Translate(xyz=center)
@@ -0,0 +1,32 @@
+
+(Machine Setup)
+G90  (Absolute Position Mode)
+G21  (Units = millimeters)
+
+(grid)
+(Grid cell 0,0 )
+(square)
+G0 X0.000 Y4.000 F3000.0
+G0 Z0.000
+G1 F500.0
+M4 S400.0 (Laser on @ 40%)
+G1 X0.000 Y6.000 (Left)
+G1 X3.000 Y6.000 (Top)
+G1 X3.000 Y4.000 (Right)
+G1 X0.000 Y4.000 (Bottom)
+M5        (Laser off)
+(square done)
+(Grid cell 0,1 )
+( *Empty Cell* )
+(Grid cell 1,0 )
+( *Empty Cell* )
+(Grid cell 1,1 )
+G0 X3.000 Y0.000 F3000.0
+G0 Z0.000
+G1 F500.0
+M4 S200.0 (Laser on @ 20%)
+G1 X3.000 Y4.000
+M5        (Laser off)
+(end of grid)
+
+M2 (End Document)
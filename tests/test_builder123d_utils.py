@@ -0,0 +1,51 @@
+from build123d import Edge, Location, Wire
+
+import builder123d_utils  # noqa: F401  Binds Wire.is_circle, Face.circular_holes
+from conftest import part_load
+
+
+def holed_face():
+    # Part has 4 bores through its top face.
+    part = part_load("tests/bore-test-part.step")
+    return max(part.faces(), key=lambda f: len(f.inner_wires()))
+
+
+def test_circular_holes_follow_move():
+    """
+    Cached holes are recomputed after the face is moved.
+    """
+    face = holed_face()
+    before = face.circular_holes
+    assert len(before) == 4
+    assert all(wire.is_circle for wire in before)
+
+    face.move(Location((5, 0, 0)))
+    after = face.circular_holes
+    assert len(after) == 4
+
+    x_before = sorted(wire.center().X for wire in before)
+    x_after = sorted(wire.center().X for wire in after)
+    for xb, xa in zip(x_before, x_after):
+        assert abs(xa - xb - 5) < 1e-6
+
+
+def test_circular_holes_returns_copy():
+    """
+    Mutating the returned list does not affect later reads.
+    """
+    face = holed_face()
+    face.circular_holes.pop()
+    assert len(face.circular_holes) == 4
+
+
+def test_square_hole_is_not_circle():
+    """
+    Two-edge wires of non-circular edges are rejected without error.
+    """
+    wire = Wire(
+        [
+            Edge.make_line((0, 0, 0), (1, 0, 0)),
+            Edge.make_line((1, 0, 0), (0, 0, 0)),
+        ]
+    )
+    assert not builder123d_utils.wire_is_circle(wire)
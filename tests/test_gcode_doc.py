@@ -0,0 +1,283 @@
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+import gcode_doc
+
+
+def _py_func(kernel):
+    # numba dispatchers keep the original Python function as py_func.
+    return getattr(kernel, "py_func", kernel)
+
+
+def _numba_func(kernel):
+    pytest.importorskip("numba")
+    return kernel
+
+
+@pytest.mark.parametrize("wrap", [_py_func, _numba_func], ids=["python", "numba"])
+def test_cell_origins_loop_matches_numpy(wrap):
+    """
+    The loop kernel places every cell where the NumPy version does.
+    """
+    rng = np.random.default_rng(0)
+    rows, cols = 4, 7
+    widths = rng.uniform(1, 10, (rows, cols))
+    heights = rng.uniform(1, 10, (rows, cols))
+    col_widths = widths.max(axis=0) + 2
+    row_heights = heights.max(axis=1) + 2
+
+    loop = wrap(gcode_doc._compute_cell_origins_loop)
+    xs, ys = loop(col_widths, row_heights, widths, heights, 1.5, -3.0)
+    xs_np, ys_np = gcode_doc._compute_cell_origins(
+        col_widths, row_heights, widths, heights, 1.5, -3.0
+    )
+
+    np.testing.assert_allclose(xs, xs_np, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(ys, ys_np, rtol=1e-12, atol=1e-12)
+
+
+def test_text_space_advance():
+    """
+    A space advances 12 units, 4 more than a character.
+    """
+    assert gcode_doc.Text("A A").offset_x == 8 + 12 + 8
+    assert gcode_doc.Text("AA").offset_x == 8 + 8
+
+    # Word gap shows up in the rendered width, 1 mm text is 9 units tall.
+    width_gap = gcode_doc.Text("A A", size_mm=9).Size()[0]
+    width = gcode_doc.Text("AA", size_mm=9).Size()[0]
+    assert width_gap - width == pytest.approx(12)
+
+
+@pytest.mark.parametrize("name", ["_GLYPH_B", "_GLYPH_Q"])
+def test_glyph_no_zero_length_moves(name):
+    """
+    No glyph point repeats the previous point while the laser is on.
+    """
+    laser_on = False
+    last = None
+    for item in getattr(gcode_doc, name):
+        if item == gcode_doc.TextCommand.ON:
+            laser_on = True
+        elif item == gcode_doc.TextCommand.OFF:
+            laser_on = False
+        elif isinstance(item, tuple):
+            assert not (laser_on and item == last)
+            last = item
+
+
+def test_glyph_c_travels_from_origin():
+    """
+    C starts with a travel move to its origin, which is part of its
+    bounding box.  At 45 degrees that sets the bottom of the text.
+    """
+    t = gcode_doc.Text("C", size_mm=9, rotation_deg=45)
+    assert t.Size()[1] == pytest.approx(13 / np.sqrt(2))
+
+
+ALL_CHARACTERS = " %+-.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def test_text_all_characters_gcode():
+    """
+    Rendering every supported character matches the stored G-code.
+    """
+    assert set(ALL_CHARACTERS) == set(gcode_doc.Text._CHAR_TABLE)
+
+    doc = gcode_doc.Doc()
+    doc.layout.AddChild(gcode_doc.Text(ALL_CHARACTERS, size_mm=3, x=1, y=2))
+    doc.GCode()
+
+    with open("tests/text_all_characters.nc") as fp:
+        assert doc.code == fp.read()
+
+
+@pytest.mark.parametrize(
+    "rotation_deg, size", [(0, (291.0, 9.0)), (90, (9.0, 291.0))]
+)
+def test_text_all_characters_size(rotation_deg, size):
+    """
+    Size of the full character set, 1 unit per glyph unit.
+    """
+    t = gcode_doc.Text(ALL_CHARACTERS, size_mm=9, rotation_deg=rotation_deg)
+    assert t.Size() == pytest.approx(size)
+
+
+@pytest.mark.parametrize("wrap", [_py_func, _numba_func], ids=["python", "numba"])
+@pytest.mark.parametrize("rotation_deg", [0, 30, 90])
+@pytest.mark.parametrize("n", [0, 1, 50])
+def test_transform_points_loop_matches_numpy(wrap, rotation_deg, n):
+    """
+    The loop kernel transforms and shifts points like the NumPy version,
+    including for no points.
+    """
+    pts = np.random.default_rng(n).uniform(-5, 9, (n, 2))
+    angle = np.radians(rotation_deg)
+    c = np.cos(angle) * 0.5
+    s = np.sin(angle) * 0.5
+
+    loop = wrap(gcode_doc._transform_points_loop)
+    out, width, height = loop(pts, c, -s, s, c)
+    out_np, width_np, height_np = gcode_doc._transform_points(pts, c, -s, s, c)
+
+    assert out.shape == out_np.shape == (n, 2)
+    np.testing.assert_allclose(out, out_np, rtol=1e-12, atol=1e-12)
+    assert width == pytest.approx(width_np, rel=1e-12, abs=1e-12)
+    assert height == pytest.approx(height_np, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    "shape",
+    [
+        lambda: gcode_doc.Text("AB"),
+        lambda: gcode_doc.Line(length=5),
+        lambda: gcode_doc.Rectangle(width=3, height=2),
+    ],
+    ids=["text", "line", "rectangle"],
+)
+def test_shape_gcode_returns_doc_code(shape):
+    """
+    Shape GCode returns the document G-code, as before.
+    """
+    doc = gcode_doc.Doc()
+    code = shape().GCode(doc)
+    assert code == doc.code
+    assert code
+
+
+def test_text_render_cache_lru(monkeypatch):
+    """
+    Render cache hits are kept, the least recently used entry is dropped.
+    """
+    cache = OrderedDict()
+    monkeypatch.setattr(gcode_doc.Text, "_RENDER_CACHE", cache)
+    monkeypatch.setattr(gcode_doc.Text, "_RENDER_CACHE_SIZE", 2)
+
+    gcode_doc.Text("A")
+    gcode_doc.Text("B")
+    gcode_doc.Text("A")  # Hit, A is now most recently used.
+    gcode_doc.Text("C")  # Full, drops B.
+
+    assert [key[0] for key in cache] == ["A", "C"]
+
+
+def test_text_render_cache_shared_data_read_only():
+    """
+    Cached renderings can not be changed through a Text object.
+    """
+    t = gcode_doc.Text("AB")
+    gcode_doc.Text("AB")  # Cache hit shares the same data.
+
+    with pytest.raises(TypeError):
+        t.comments[0] = "(changed)"
+    with pytest.raises(ValueError):
+        t.xy[0, 0] = 1.0
+
+
+def test_shape_base_gcode_returns_doc_code():
+    """
+    Subclasses that return super().GCode(doc) get the document G-code.
+    """
+
+    class Marker(gcode_doc.Shape):
+        def Size(self):
+            return (0, 0)
+
+        def GCode(self, doc):
+            return super().GCode(doc)
+
+    doc = gcode_doc.Doc()
+    code = Marker(x=1, y=2).GCode(doc)
+    assert isinstance(code, str)
+    assert code == doc.code
+    assert "G0 X1.000 Y2.000" in code
+
+
+def test_doc_gcode_joins_once(monkeypatch):
+    """
+    Emitting a layout of shapes does not join the document G-code per shape.
+    """
+    reads = []
+    code = gcode_doc.Doc.code
+    monkeypatch.setattr(
+        gcode_doc.Doc,
+        "code",
+        property(lambda self: reads.append(1) or code.fget(self), code.fset),
+    )
+
+    doc = gcode_doc.Doc()
+    grid = gcode_doc.GridLayout(rows=10, columns=10)
+    for i in range(10):
+        for j in range(10):
+            grid.AddChildCell(gcode_doc.Rectangle(width=2, height=1), i, j)
+    grid.AddChildCell(gcode_doc.Text("AB"), 0, 0)
+    grid.AddChildCell(gcode_doc.Line(length=3), 1, 1)
+    doc.layout.AddChild(grid)
+    doc.GCode()
+
+    assert len(reads) <= 1
+
+
+def test_layout_size_follows_child_change():
+    """
+    Changing a shape after adding it clears the cached layout sizes.
+    """
+    rect = gcode_doc.Rectangle(width=2, height=1)
+    grid = gcode_doc.GridLayout(rows=1, columns=2)
+    grid.AddChildCell(rect, 0, 0)
+    grid.AddChildCell(gcode_doc.Rectangle(width=3, height=1), 0, 1)
+    assert grid.Size() == pytest.approx((5, 1))
+
+    rect.width = 4
+    rect.height = 2
+    assert grid.Size() == pytest.approx((7, 2))
+
+
+def test_layout_size_with_shared_child():
+    """
+    A shape added to two layouts invalidates both of them.
+    """
+    rect = gcode_doc.Rectangle(width=2, height=1)
+    first = gcode_doc.GridLayout(rows=1, columns=1)
+    second = gcode_doc.GridLayout(rows=1, columns=1)
+    first.AddChild(rect)
+    second.AddChild(rect)
+    assert first.Size() == pytest.approx((2, 1))
+    assert second.Size() == pytest.approx((2, 1))
+
+    rect.width = 5
+    assert first.Size() == pytest.approx((5, 1))
+    assert second.Size() == pytest.approx((5, 1))
+    assert rect.parent is second
+
+
+def _debug_comments_doc():
+    doc = gcode_doc.Doc()
+    grid = gcode_doc.GridLayout(rows=2, columns=2)
+    grid.header = "grid"
+    grid.footer = "end of grid"
+    rect = gcode_doc.Rectangle(width=3, height=2, laser_power=40)
+    rect.header = "square"
+    rect.footer = "square done"
+    grid.AddChildCell(rect, 0, 0)
+    grid.AddChildCell(gcode_doc.Line(length=4, angle_deg=90), 1, 1)
+    doc.layout.AddChild(grid)
+    return doc
+
+
+@pytest.mark.parametrize("debug", [False, True], ids=["off", "on"])
+def test_debug_comments(debug):
+    """
+    Grid cell, empty cell and shape header/footer comments only appear
+    with debug_comments set.  The "on" output is the baseline output.
+    """
+    doc = _debug_comments_doc()
+    assert doc.debug_comments is False
+    doc.debug_comments = debug
+    doc.GCode()
+
+    name = "on" if debug else "off"
+    with open(f"tests/debug_comments_{name}.nc") as fp:
+        assert doc.code == fp.read()
@@ -0,0 +1,190 @@
+import re
+
+import numpy as np
+import pytest
+
+import gcode_utils
+from gcode_utils import GcodeUtils
+
+# Small job in the style of the tests/*.nc files, with arcs and integer,
+# negative and fractional coordinates.  Z starts at its maximum.
+SNIPPET = """G90
+G21
+G0 X-10 Y-5.5 Z2
+G1 Z-0.5 F300
+G1 X10.25 Y-5.5 F600
+G2 X12 Y2 I1.75 J3.75
+G3 X0 Y4 I-6 J-1
+G1 X-10 Y4 Z-1
+M4 S400
+G1 X-10 Y-5.5
+"""
+
+# Moves with all of X, Y and Z, the only ones Rotate changes.
+XYZ_SNIPPET = """G0 X-10 Y-5.5 Z2 F1000
+G1 X10.25 Y-5.5 Z-0.5 F300
+G1 X12 Y2 Z-0.5
+G1 X-10 Y4 Z-1
+"""
+
+
+def values(gcode: str, axis: str) -> np.ndarray:
+    return np.array(re.findall(axis + r"([+-]?[0-9.]+)", gcode), dtype=float)
+
+
+def test_extents_decreasing_values():
+    """
+    The first value on an axis can be its maximum.
+    """
+    gcu = GcodeUtils(gcode="G1 X5 Y1\nG1 X3 Y2\nG1 X-1 Y0\n")
+    ext = gcu.Extents()
+    assert ext.tolist() == [-1, 0, 0, 5, 2, 0]
+
+
+def test_extents_snippet():
+    gcu = GcodeUtils(gcode=SNIPPET)
+    assert gcu.Extents().tolist() == [-10, -5.5, -1, 12, 4, 2]
+    assert gcu.Center().tolist() == [1, -0.75, 0.5]
+
+
+def test_scale_round_trip():
+    """
+    Scaling up then down restores the coordinates and keeps the center.
+    """
+    gcu = GcodeUtils(gcode=SNIPPET)
+    center = gcu.Center()
+
+    gcu.Scale(2.0)
+    np.testing.assert_allclose(gcu.Center(), center, atol=1e-3)
+    gcu.Scale(0.5)
+
+    np.testing.assert_allclose(gcu.Center(), center, atol=1e-3)
+    for axis in "XYZ":
+        np.testing.assert_allclose(
+            values(gcu.gcode, axis), values(SNIPPET, axis), atol=1e-3
+        )
+
+
+def test_rotate_round_trip():
+    """
+    Rotating by a matrix and then by its inverse restores the coordinates
+    of every XYZ move, about the unchanged center.
+    """
+    rotation = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1.0]])
+
+    gcu = GcodeUtils(gcode=XYZ_SNIPPET)
+    center = gcu.Center()
+    gcu.Rotate(rotation)
+    np.testing.assert_allclose(gcu.Center(), center, atol=1e-3)
+    gcu.Rotate(rotation.T)
+
+    np.testing.assert_allclose(gcu.Center(), center, atol=1e-3)
+    for axis in "XYZ":
+        np.testing.assert_allclose(
+            values(gcu.gcode, axis), values(XYZ_SNIPPET, axis), atol=1e-3
+        )
+
+
+# Expected output of each operation on SNIPPET.  Values are written as
+# integers where possible, otherwise with 3 decimals.  Words an operation
+# does not touch keep their original text.
+EXPECTED = {
+    "translate": """G90
+G21
+G0 X-8.500 Y-7.500 Z2.250
+G1 Z-0.250 F300
+G1 X11.750 Y-7.500 F600
+G2 X13.500 Y0 I1.75 J3.75
+G3 X1.500 Y2 I-6 J-1
+G1 X-8.500 Y2 Z-0.750
+M4 S400
+G1 X-8.500 Y-7.500
+""",
+    "scale": """G90
+G21
+G0 X-21 Y-10.250 Z3.500
+G1 Z-1.500 F300
+G1 X19.500 Y-10.250 F600
+G2 X23 Y4.750 I1.75 J3.75
+G3 X-1 Y8.750 I-6 J-1
+G1 X-21 Y8.750 Z-2.500
+M4 S400
+G1 X-21 Y-10.250
+""",
+    "mirror_x": """G90
+G21
+G0 X-10 Y5.500 Z2
+G1 Z-0.5 F300
+G1 X10.25 Y5.500 F600
+G2 X12 Y-2 I1.75 J-3.750
+G3 X0 Y-4 I-6 J1
+G1 X-10 Y-4 Z-1
+M4 S400
+G1 X-10 Y5.500
+""",
+    "mirror_y": """G90
+G21
+G0 X10 Y-5.5 Z2
+G1 Z-0.5 F300
+G1 X-10.250 Y-5.5 F600
+G2 X-12 Y2 I-1.750 J3.75
+G3 X0 Y4 I6 J-1
+G1 X10 Y4 Z-1
+M4 S400
+G1 X10 Y-5.5
+""",
+    "rotate": """G90
+G21
+G0 X5.750 Y-11.750 Z2
+G1 Z-0.500 F300
+G1 X10.250 Y-5.500 F600
+G2 X12 Y2 I1.75 J3.75
+G3 X0 Y4 I-6 J-1
+G1 X-3.750 Y-11.750 Z-1
+M4 S400
+G1 X-10 Y-5.500
+""",
+    "replace": """G90
+G21
+G0 X-10 Y-5.5 Z2
+G1 Z-0.5 F350
+G1 X10.25 Y-5.5 F600
+G2 X12 Y2 I1.75 J3.75
+G3 X0 Y4 I-6 J-1
+G1 X-10 Y4 Z-1
+M4 S400
+G1 X-10 Y-5.5
+""",
+}
+
+OPERATIONS = {
+    "translate": lambda gcu: gcu.Translate(1.5, -2, 0.25),
+    "scale": lambda gcu: gcu.Scale(2.0),
+    "mirror_x": lambda gcu: gcu.MirrorX(),
+    "mirror_y": lambda gcu: gcu.MirrorY(),
+    "rotate": lambda gcu: gcu.Rotate(
+        np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1.0]])
+    ),
+    "replace": lambda gcu: gcu.ReplaceValue("F", 300, 350),
+}
+
+
+@pytest.mark.parametrize("name", list(OPERATIONS))
+def test_operation_output(name):
+    gcu = GcodeUtils(gcode=SNIPPET)
+    OPERATIONS[name](gcu)
+    assert gcu.gcode == EXPECTED[name]
+
+
+def test_rewrite_pattern_groups():
+    """
+    Rewrites splice on capture groups, so the group counts are fixed.
+    """
+    assert gcode_utils._RE_AXIS.groups == 2
+    assert gcode_utils._RE_XI.groups == 2
+    assert gcode_utils._RE_YJ.groups == 2
+    assert gcode_utils._RE_XYZ.groups == 3
+
+    gcu = GcodeUtils(gcode=SNIPPET)
+    with pytest.raises(ValueError):
+        gcu._rewrite(gcode_utils._RE_XYZ, lambda axes, values: values)
@@ -0,0 +1,649 @@
+
+(Machine Setup)
+G90  (Absolute Position Mode)
+G21  (Units = millimeters)
+
+G0 X0.000 Y0.000 F3000.0
+G0 Z0.000
+G1 F500.0
+(Character: %)
+F3000.0
+G0 X0.000 Y2.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X0.000 Y2.667 Z0
+G1 X0.333 Y3.000 Z0
+G1 X0.667 Y2.667 Z0
+G1 X0.667 Y2.333 Z0
+G1 X0.333 Y2.000 Z0
+G1 X0.000 Y2.333 Z0
+M5        (Laser off)
+F3000.0
+G0 X0.000 Y0.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X1.667 Y2.667 Z0
+M5        (Laser off)
+F3000.0
+G0 X1.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X1.000 Y0.667 Z0
+G1 X1.333 Y1.000 Z0
+G1 X1.667 Y0.667 Z0
+G1 X1.667 Y0.333 Z0
+G1 X1.333 Y0.000 Z0
+G1 X1.000 Y0.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: +)
+F3000.0
+G0 X2.333 Y1.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X3.667 Y1.667 Z0
+M5        (Laser off)
+F3000.0
+G0 X3.000 Y1.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X3.000 Y2.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: -)
+F3000.0
+G0 X4.667 Y1.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X6.000 Y1.667 Z0
+M5        (Laser off)
+F3000.0
+(Character: .)
+F3000.0
+G0 X6.500 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X6.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: 0)
+F3000.0
+G0 X7.000 Y0.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X7.000 Y2.667 Z0
+G1 X7.333 Y3.000 Z0
+G1 X8.000 Y3.000 Z0
+G1 X8.333 Y2.667 Z0
+G1 X8.333 Y0.333 Z0
+G1 X8.000 Y0.000 Z0
+G1 X7.333 Y0.000 Z0
+G1 X7.000 Y0.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: 1)
+F3000.0
+G0 X10.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X10.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: 2)
+F3000.0
+G0 X13.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X11.667 Y0.000 Z0
+G1 X13.000 Y2.667 Z0
+G1 X12.333 Y3.000 Z0
+G1 X11.667 Y2.667 Z0
+M5        (Laser off)
+F3000.0
+(Character: 3)
+F3000.0
+G0 X14.000 Y0.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X14.667 Y0.000 Z0
+G1 X15.333 Y0.333 Z0
+G1 X15.333 Y1.333 Z0
+G1 X15.000 Y1.667 Z0
+G1 X14.333 Y1.667 Z0
+M5        (Laser off)
+F3000.0
+G0 X15.000 Y1.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X15.333 Y2.000 Z0
+G1 X15.333 Y2.667 Z0
+G1 X14.667 Y3.000 Z0
+G1 X14.000 Y2.667 Z0
+M5        (Laser off)
+F3000.0
+(Character: 4)
+F3000.0
+G0 X16.333 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X16.333 Y1.667 Z0
+G1 X17.667 Y1.667 Z0
+M5        (Laser off)
+F3000.0
+G0 X17.667 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X17.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: 5)
+F3000.0
+G0 X20.000 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X18.667 Y3.000 Z0
+G1 X18.667 Y1.667 Z0
+G1 X19.333 Y1.667 Z0
+G1 X20.000 Y1.000 Z0
+G1 X20.000 Y0.333 Z0
+G1 X19.667 Y0.000 Z0
+G1 X18.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: 6)
+F3000.0
+G0 X22.333 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X21.667 Y3.000 Z0
+G1 X21.000 Y2.333 Z0
+G1 X21.000 Y0.333 Z0
+G1 X21.333 Y0.000 Z0
+G1 X22.000 Y0.000 Z0
+G1 X22.333 Y0.667 Z0
+G1 X22.333 Y1.000 Z0
+G1 X21.667 Y1.667 Z0
+G1 X21.000 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+F3000.0
+(Character: 7)
+G0 X23.333 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X24.667 Y3.000 Z0
+G1 X23.333 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: 8)
+F3000.0
+G0 X26.333 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X26.667 Y0.000 Z0
+G1 X27.000 Y0.333 Z0
+G1 X27.000 Y1.333 Z0
+G1 X26.667 Y1.667 Z0
+G1 X26.000 Y1.667 Z0
+G1 X25.667 Y2.000 Z0
+G1 X25.667 Y2.667 Z0
+G1 X26.000 Y3.000 Z0
+G1 X26.667 Y3.000 Z0
+G1 X27.000 Y2.667 Z0
+G1 X27.000 Y2.000 Z0
+G1 X26.667 Y1.667 Z0
+G1 X26.000 Y1.667 Z0
+G1 X25.667 Y1.333 Z0
+G1 X25.667 Y0.333 Z0
+G1 X26.000 Y0.000 Z0
+G1 X26.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: 9)
+F3000.0
+G0 X29.333 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X29.333 Y2.333 Z0
+G1 X29.000 Y3.000 Z0
+G1 X28.333 Y3.000 Z0
+G1 X28.000 Y2.333 Z0
+G1 X28.333 Y1.333 Z0
+G1 X29.333 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: A)
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X30.333 Y0.000 Z0
+G1 X30.333 Y2.333 Z0
+G1 X30.667 Y2.667 Z0
+G1 X31.000 Y3.000 Z0
+G1 X31.333 Y3.000 Z0
+G1 X31.667 Y2.667 Z0
+G1 X32.000 Y2.333 Z0
+G1 X32.000 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X32.000 Y1.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X30.333 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: B)
+F3000.0
+G0 X33.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X33.000 Y3.000 Z0
+G1 X34.000 Y3.000 Z0
+G1 X34.333 Y2.667 Z0
+G1 X34.667 Y2.333 Z0
+G1 X34.667 Y2.000 Z0
+G1 X34.333 Y1.667 Z0
+G1 X34.000 Y1.333 Z0
+G1 X33.000 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+G0 X34.000 Y1.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X34.333 Y1.000 Z0
+G1 X34.667 Y0.667 Z0
+G1 X34.667 Y0.333 Z0
+G1 X34.333 Y0.000 Z0
+G1 X33.000 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: C)
+F3000.0
+G0 X35.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X37.333 Y0.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X37.000 Y0.000 Z0
+G1 X36.000 Y0.000 Z0
+G1 X35.667 Y0.333 Z0
+G1 X35.667 Y2.667 Z0
+G1 X36.000 Y3.000 Z0
+G1 X37.000 Y3.000 Z0
+G1 X37.333 Y2.667 Z0
+M5        (Laser off)
+F3000.0
+(Character: D)
+F3000.0
+G0 X38.333 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X38.333 Y3.000 Z0
+G1 X39.333 Y3.000 Z0
+G1 X39.667 Y2.667 Z0
+G1 X40.000 Y2.333 Z0
+G1 X40.000 Y0.667 Z0
+G1 X39.667 Y0.333 Z0
+G1 X39.333 Y0.000 Z0
+G1 X38.333 Y0.000 Z0
+G1 X38.333 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: E)
+F3000.0
+G0 X41.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X41.000 Y3.000 Z0
+G1 X42.667 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X42.667 Y1.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X41.000 Y1.667 Z0
+M5        (Laser off)
+F3000.0
+G0 X42.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X41.000 Y0.000 Z0
+G1 X41.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: F)
+F3000.0
+G0 X43.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X43.667 Y3.000 Z0
+G1 X45.333 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X45.333 Y1.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X43.667 Y1.667 Z0
+M5        (Laser off)
+F3000.0
+G0 X43.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X43.667 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: G)
+M5        (Laser off)
+F3000.0
+G0 X48.000 Y2.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X47.667 Y3.000 Z0
+G1 X46.667 Y3.000 Z0
+G1 X46.333 Y2.667 Z0
+G1 X46.333 Y0.333 Z0
+G1 X46.667 Y0.000 Z0
+G1 X47.667 Y0.000 Z0
+G1 X48.000 Y0.333 Z0
+G1 X48.000 Y1.333 Z0
+G1 X47.667 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: H)
+F3000.0
+G0 X49.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X49.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X50.667 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X50.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X49.000 Y1.667 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X50.667 Y1.667 Z0
+M5        (Laser off)
+F3000.0
+(Character: I)
+F3000.0
+G0 X51.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X53.000 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X53.000 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X51.667 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X52.333 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X52.333 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: J)
+F3000.0
+G0 X54.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X54.333 Y0.000 Z0
+G1 X54.667 Y0.333 Z0
+G1 X54.667 Y3.000 Z0
+G1 X54.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X54.667 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X55.333 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: K)
+F3000.0
+G0 X56.333 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X56.333 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X58.000 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X58.000 Y2.333 Z0
+G1 X57.667 Y2.000 Z0
+G1 X57.333 Y1.667 Z0
+G1 X57.000 Y1.333 Z0
+G1 X56.667 Y1.333 Z0
+G1 X56.333 Y1.333 Z0
+G1 X57.000 Y1.333 Z0
+G1 X57.333 Y1.000 Z0
+G1 X57.667 Y0.667 Z0
+G1 X58.000 Y0.333 Z0
+G1 X58.000 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: L)
+F3000.0
+G0 X59.000 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X59.000 Y0.000 Z0
+G1 X60.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: M)
+F3000.0
+G0 X61.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X61.667 Y3.000 Z0
+G1 X62.000 Y2.667 Z0
+G1 X62.333 Y2.333 Z0
+G1 X62.667 Y2.000 Z0
+G1 X62.667 Y1.667 Z0
+G1 X62.667 Y2.000 Z0
+G1 X63.000 Y2.333 Z0
+G1 X63.333 Y2.667 Z0
+G1 X63.667 Y3.000 Z0
+G1 X63.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: N)
+F3000.0
+G0 X64.333 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X64.333 Y3.000 Z0
+G1 X66.000 Y0.000 Z0
+G1 X66.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: O)
+F3000.0
+G0 X67.000 Y0.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X67.000 Y2.667 Z0
+G1 X67.333 Y3.000 Z0
+G1 X68.333 Y3.000 Z0
+G1 X68.667 Y2.667 Z0
+G1 X68.667 Y0.333 Z0
+G1 X68.333 Y0.000 Z0
+G1 X67.333 Y0.000 Z0
+G1 X67.000 Y0.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: P)
+F3000.0
+G0 X69.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X69.667 Y2.667 Z0
+G1 X70.000 Y3.000 Z0
+G1 X71.000 Y3.000 Z0
+G1 X71.333 Y2.667 Z0
+G1 X71.333 Y1.667 Z0
+G1 X71.000 Y1.333 Z0
+G1 X69.667 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: Q)
+F3000.0
+G0 X72.333 Y0.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X72.333 Y2.667 Z0
+G1 X72.667 Y3.000 Z0
+G1 X73.667 Y3.000 Z0
+G1 X74.000 Y2.667 Z0
+G1 X74.000 Y0.667 Z0
+G1 X73.667 Y0.333 Z0
+G1 X74.000 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X73.667 Y0.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X73.333 Y0.000 Z0
+G1 X72.667 Y0.000 Z0
+G1 X72.333 Y0.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: R)
+F3000.0
+G0 X75.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X75.000 Y2.667 Z0
+G1 X75.333 Y3.000 Z0
+G1 X76.000 Y3.000 Z0
+G1 X76.333 Y2.667 Z0
+G1 X76.667 Y2.333 Z0
+G1 X76.667 Y2.000 Z0
+G1 X76.333 Y1.667 Z0
+G1 X76.000 Y1.333 Z0
+G1 X75.000 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+G0 X76.000 Y1.333 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X76.333 Y1.000 Z0
+G1 X76.667 Y0.667 Z0
+G1 X76.667 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: S)
+F3000.0
+G0 X77.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X79.000 Y0.000 Z0
+G1 X79.333 Y0.333 Z0
+G1 X79.333 Y1.000 Z0
+G1 X79.000 Y1.333 Z0
+G1 X78.000 Y1.333 Z0
+G1 X77.667 Y1.667 Z0
+G1 X77.667 Y2.667 Z0
+G1 X78.000 Y3.000 Z0
+G1 X79.333 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: T)
+F3000.0
+G0 X81.000 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X81.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X80.333 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X81.667 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: U)
+F3000.0
+G0 X82.667 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X82.667 Y0.333 Z0
+G1 X83.000 Y0.000 Z0
+G1 X84.000 Y0.000 Z0
+G1 X84.333 Y0.333 Z0
+G1 X84.333 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: V)
+F3000.0
+G0 X85.333 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X86.000 Y0.000 Z0
+G1 X86.667 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: W)
+F3000.0
+G0 X87.667 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X88.333 Y0.000 Z0
+G1 X88.667 Y3.000 Z0
+G1 X89.000 Y0.000 Z0
+G1 X89.667 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: X)
+F3000.0
+G0 X90.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X92.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X90.667 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X92.000 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+(Character: Y)
+F3000.0
+G0 X93.667 Y0.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X93.667 Y1.333 Z0
+G1 X93.000 Y2.000 Z0
+G1 X93.000 Y3.000 Z0
+M5        (Laser off)
+F3000.0
+G0 X94.333 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X94.333 Y2.000 Z0
+G1 X93.667 Y1.333 Z0
+M5        (Laser off)
+F3000.0
+(Character: Z)
+F3000.0
+G0 X95.333 Y3.000 Z0
+M4 S200.0 (Laser on @ 20%)
+F500.0
+G1 X97.000 Y3.000 Z0
+G1 X95.333 Y0.000 Z0
+G1 X97.000 Y0.000 Z0
+M5        (Laser off)
+F3000.0
+M5        (Laser off)
+
+M2 (End Document)